@@ -4,6 +4,10 @@
 # SPDX-FileCopyrightText: © 2025 Sysand contributors <opensource@sensmetry.com>
 
 import argparse
+import collections
+import concurrent.futures
+import functools
+import hashlib
 import json
 import os
 from pathlib import Path
@@ -12,7 +16,12 @@ import shutil
 import subprocess
 from typing import Any, Union
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None  # type: ignore[assignment]
 
+SYSTEM = platform.system()
 ROOT_DIR = Path(__file__).absolute().parent.parent.parent.parent
 TARGET_DIR = ROOT_DIR / "target"
 BUILD_DIR = TARGET_DIR / "java"
@@ -20,6 +29,20 @@ TEST_DIR = TARGET_DIR / "java-test"
 DEPLOY_TEST_DIR = TARGET_DIR / "java-deploy-test"
 PLUGIN_DIR = TARGET_DIR / "java-plugin"
 VERSION_FILE = ROOT_DIR / "version.txt"
+JAVA_MANIFEST_PATH = ROOT_DIR / "bindings" / "java" / "Cargo.toml"
+NATIVE_LIB_CRATES_DIRS = [
+    ROOT_DIR / "bindings" / "java",
+    ROOT_DIR / "core",
+    ROOT_DIR / "macros",
+]
+VERSION_CACHE_FILE = TARGET_DIR / ".cargo-metadata-version.json"
+# Written by `sync_tree` into the trees it copies.
+SYNC_STAMP_NAME = ".sync-stamp"
+# `pom.xml` templates are written by `write_pom`, so `sync_tree` skips them.
+POM_TEMPLATE_EXCLUDE = frozenset(["pom.xml"])
+# Resolve artifacts in parallel. Every pom here is a single module, so
+# parallel builds (`-T`) would have nothing to run concurrently.
+MVN_PARALLEL_ARGS = ["-Dmaven.artifact.threads=8"]
 
 
 def parse_args() -> argparse.Namespace:
@@ -47,6 +70,11 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Sign the artifacts with the GPG key.",
     )
+    build_parser.add_argument(
+        "--clean",
+        action="store_true",
+        help="Remove all previous build outputs, including Maven's, before building.",
+    )
     build_plugin_parser = subparsers.add_parser(
         "build-plugin", help="Build the sysand Maven plugin."
     )
@@ -69,30 +97,244 @@ def parse_args() -> argparse.Namespace:
 
 
 def mvn_executable() -> str:
-    if platform.system() == "Windows":
+    if SYSTEM == "Windows":
         return "mvn.cmd"
     return "mvn"
 
 
+def native_lib_name() -> str:
+    if SYSTEM == "Darwin":
+        return "libsysand.dylib"
+    elif SYSTEM == "Windows":
+        return "sysand.dll"
+    return "libsysand.so"
+
+
+def native_lib_is_up_to_date(native_lib_path: Path) -> bool:
+    try:
+        native_lib_mtime = native_lib_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+    # The native library is built from the Java bindings crate and all the
+    # workspace crates it depends on, with the toolchain and cargo settings
+    # of the workspace. Inputs that do not exist are skipped below.
+    inputs = [
+        ROOT_DIR / "Cargo.toml",
+        ROOT_DIR / "Cargo.lock",
+        ROOT_DIR / "rust-toolchain.toml",
+        ROOT_DIR / ".cargo" / "config.toml",
+        ROOT_DIR / ".cargo" / "config",
+    ]
+    for crate_dir in NATIVE_LIB_CRATES_DIRS:
+        inputs.append(crate_dir / "Cargo.toml")
+        inputs.extend((crate_dir / "src").rglob("*"))
+    return all(
+        path.stat().st_mtime_ns < native_lib_mtime for path in inputs if path.is_file()
+    )
+
+
 def execute(command: "list[str]", *args: Any, **kwargs: Any) -> None:
     print("Executing:", " ".join(command))
-    try:
-        output = subprocess.check_output(  # type: ignore[call-overload]
-            command, *args, **kwargs, text=True, stderr=subprocess.STDOUT
+    # Stream the output as it is produced and only keep its tail around for
+    # the raised error.
+    output_tail: "collections.deque[str]" = collections.deque(maxlen=1000)
+    with subprocess.Popen(  # type: ignore[call-overload]
+        command,
+        *args,
+        **kwargs,
+        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    ) as process:
+        for line in process.stdout:
+            print(line, end="", flush=True)
+            output_tail.append(line)
+    if process.returncode != 0:
+        print("Error:", process.returncode)
+        raise subprocess.CalledProcessError(
+            process.returncode, command, output="".join(output_tail)
         )
-    except subprocess.CalledProcessError as error:
-        print("Error:", error.returncode)
-        print(error.output)
-        raise error
     print("Success")
-    print(output)
 
 
-def parse_version() -> str:
-    if VERSION_FILE.exists():
-        print("Using version from version.txt")
-        return VERSION_FILE.read_text().strip()
-    print("Getting version from Cargo.toml")
+def copy_native_lib(source_path: Path, target_path: Path) -> None:
+    # Metadata is not needed in the fresh build directory, so skip `copystat`
+    # and let the OS do the copy: `shutil.copyfile` uses `sendfile`/`fcopyfile`
+    # on Linux/macOS and `CopyFileExW` is the Windows equivalent.
+    if SYSTEM == "Windows":
+        import ctypes
+        from ctypes import wintypes
+
+        # A private `WinDLL` instance so that the prototype below does not
+        # leak into other users of `ctypes.windll.kernel32`, and so that the
+        # error code is captured before anything else can overwrite it.
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)  # type: ignore[attr-defined]
+        copy_file_ex = kernel32.CopyFileExW
+        copy_file_ex.argtypes = (
+            wintypes.LPCWSTR,
+            wintypes.LPCWSTR,
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            ctypes.POINTER(wintypes.BOOL),
+            wintypes.DWORD,
+        )
+        copy_file_ex.restype = wintypes.BOOL
+        if not copy_file_ex(str(source_path), str(target_path), None, None, None, 0):
+            raise ctypes.WinError(ctypes.get_last_error())  # type: ignore[attr-defined]
+        return
+    shutil.copyfile(source_path, target_path)
+
+
+def copy_tree(
+    source_dir: Path, target_dir: Path, exclude: "frozenset[str]" = frozenset()
+) -> None:
+    # `exclude` holds names of top-level entries to leave out. `copytree`
+    # reuses the stat results cached by `os.scandir` while walking.
+    shutil.copytree(
+        source_dir,
+        target_dir,
+        ignore=lambda path, names: (
+            exclude.intersection(names) if path == str(source_dir) else set()
+        ),
+    )
+
+
+def list_file_names(path: Path) -> "set[str]":
+    # `DirEntry.is_file` follows symlinks like `Path.is_file`, but only needs
+    # a `stat` call for the symlinks themselves.
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+
+def tree_stamp(source_dir: Path, exclude: "frozenset[str]") -> "tuple[str, list[str]]":
+    # Cheap change detection: relative path, size and mtime of every file, all
+    # taken from the stat results cached by `os.scandir`. The relative paths
+    # are returned as well, in the order they were hashed.
+    digest = hashlib.sha256()
+    relative_paths: "list[str]" = []
+
+    def walk(path: str) -> None:
+        with os.scandir(path) as entries:
+            for entry in sorted(entries, key=lambda entry: entry.name):
+                if path == str(source_dir) and entry.name in exclude:
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    walk(entry.path)
+                    continue
+                stat = entry.stat(follow_symlinks=False)
+                relative_path = os.path.relpath(entry.path, source_dir)
+                relative_paths.append(relative_path)
+                digest.update(
+                    f"{relative_path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode()
+                )
+
+    walk(str(source_dir))
+    return digest.hexdigest(), relative_paths
+
+
+def copy_stamp(target_dir: Path, relative_paths: "list[str]") -> str:
+    # Same as `tree_stamp`, but for the copies of the given files only, so that
+    # whatever else ends up in the target (Maven's output) does not count. An
+    # empty stamp means some copy is missing.
+    digest = hashlib.sha256()
+    for relative_path in relative_paths:
+        try:
+            stat = os.stat(target_dir / relative_path, follow_symlinks=False)
+        except FileNotFoundError:
+            return ""
+        digest.update(f"{relative_path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def sync_tree(
+    source_dir: Path, target_dir: Path, exclude: "frozenset[str]" = frozenset()
+) -> None:
+    # Copies `source_dir` to `target_dir` unless neither the sources nor the
+    # previous copy of them changed since. Top-level entries named in
+    # `exclude` are not copied.
+    #
+    # The stamp lives inside `target_dir`, so that it goes away together with
+    # the copy, and records the copy's own stamp next to the sources' one, so
+    # that editing or deleting copied files also forces a new copy.
+    stamp_path = target_dir / SYNC_STAMP_NAME
+    stamp, relative_paths = tree_stamp(source_dir, exclude)
+    try:
+        recorded_stamps = stamp_path.read_text().split("\n")
+    except OSError:
+        recorded_stamps = []
+    if (
+        len(recorded_stamps) == 2
+        and recorded_stamps[0] == stamp
+        and recorded_stamps[1] == copy_stamp(target_dir, relative_paths)
+    ):
+        print(f"{target_dir} is up to date, skipping the copy")
+        return
+    # Copy next to the target first so that the old tree is only replaced once
+    # the new one is complete.
+    new_target_dir = target_dir.with_name(f"{target_dir.name}.new")
+    shutil.rmtree(new_target_dir, ignore_errors=True)
+    copy_tree(source_dir, new_target_dir, exclude)
+    (new_target_dir / SYNC_STAMP_NAME).write_text(
+        f"{stamp}\n{copy_stamp(new_target_dir, relative_paths)}"
+    )
+    shutil.rmtree(target_dir, ignore_errors=True)
+    os.replace(new_target_dir, target_dir)
+
+
+def read_cached_version(manifest_mtimes: "list[int]") -> Union[str, None]:
+    try:
+        cache = json.loads(VERSION_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cache, dict) or cache.get("mtimes") != manifest_mtimes:
+        return None
+    version = cache.get("version")
+    return version if isinstance(version, str) else None
+
+
+def write_cached_version(manifest_mtimes: "list[int]", version: str) -> None:
+    # Write to a temporary file first so that concurrent invocations never
+    # observe a partially written cache.
+    VERSION_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = VERSION_CACHE_FILE.with_name(
+        f"{VERSION_CACHE_FILE.name}.{os.getpid()}.tmp"
+    )
+    tmp_path.write_text(json.dumps({"mtimes": manifest_mtimes, "version": version}))
+    os.replace(tmp_path, VERSION_CACHE_FILE)
+
+
+def parse_version_from_manifest() -> Union[str, None]:
+    if tomllib is None:
+        return None
+    try:
+        package = tomllib.loads(JAVA_MANIFEST_PATH.read_text())["package"]
+        if package["name"] != "sysand-java":
+            return None
+        version = package["version"]
+        if isinstance(version, dict) and version.get("workspace") is True:
+            workspace = tomllib.loads((ROOT_DIR / "Cargo.toml").read_text())
+            version = workspace["workspace"]["package"]["version"]
+    except (OSError, KeyError, TypeError, tomllib.TOMLDecodeError):
+        return None
+    return version if isinstance(version, str) else None
+
+
+def parse_version_from_cargo_metadata() -> str:
+    manifest_path = ROOT_DIR / "Cargo.toml"
+    # The version is declared in the Java bindings' manifest, possibly
+    # inherited from the workspace one, so a change to either invalidates it.
+    manifest_mtimes = [
+        manifest_path.stat().st_mtime_ns,
+        JAVA_MANIFEST_PATH.stat().st_mtime_ns,
+    ]
+    cached_version = read_cached_version(manifest_mtimes)
+    if cached_version is not None:
+        print(f"Using cached version from {VERSION_CACHE_FILE}")
+        return cached_version
+    print("Getting version from cargo metadata")
     output = subprocess.check_output(
         [
             "cargo",
@@ -101,7 +343,7 @@ def parse_version() -> str:
             "--format-version",
             "1",
             "--manifest-path",
-            ROOT_DIR / "Cargo.toml",
+            manifest_path,
         ],
         text=True,
     )
@@ -109,14 +351,33 @@ def parse_version() -> str:
     for package in metadata["packages"]:
         if package["name"] == "sysand-java":
             version: str = package["version"]
+            write_cached_version(manifest_mtimes, version)
             return version
     raise ValueError("sysand-java not found in Cargo.toml")
 
 
+@functools.lru_cache(maxsize=None)
+def parse_version() -> str:
+    if VERSION_FILE.exists():
+        print("Using version from version.txt")
+        return VERSION_FILE.read_text().strip()
+    version = parse_version_from_manifest()
+    if version is not None:
+        print("Using version from Cargo.toml")
+        return version
+    return parse_version_from_cargo_metadata()
+
+
 def create_version_file(version: str) -> None:
     VERSION_FILE.write_text(version)
 
 
+def write_pom(pom_path: Path, target_pom_path: Path, full_version: str) -> None:
+    # Substitute on the raw bytes to skip the decode/encode round-trip.
+    pom_data = pom_path.read_bytes()
+    target_pom_path.write_bytes(pom_data.replace(b"VERSION", full_version.encode()))
+
+
 def compute_full_version(version: str, release_jar_version: bool) -> str:
     if release_jar_version:
         return version
@@ -129,26 +390,43 @@ def build(
     sign_artifacts: bool,
     release_jar_version: bool,
     version: str,
+    clean: bool,
 ) -> None:
-    print("Cleaning the target directory...")
-    shutil.rmtree(BUILD_DIR, ignore_errors=True)
+    if clean:
+        print("Cleaning the target directory...")
+        shutil.rmtree(BUILD_DIR, ignore_errors=True)
+    else:
+        # Keep Maven's `target` directory so that its incremental build state
+        # is reused, but drop stale copies of the sources. The compiler
+        # plugin cleans up after deleted classes itself, but copied resources
+        # are never removed, so drop the native libraries copied into
+        # `<os>-<arch>` directories too: a stale one would end up in the JAR.
+        # Java package names cannot contain `-`, so this leaves classes alone.
+        print("Cleaning the sources and native libraries in the target directory...")
+        shutil.rmtree(BUILD_DIR / "src", ignore_errors=True)
+        for native_lib_dir in (BUILD_DIR / "target" / "classes").glob("*-*"):
+            shutil.rmtree(native_lib_dir, ignore_errors=True)
     BUILD_DIR.mkdir(parents=True, exist_ok=True)
 
+    native_lib_build_dir_name = "release" if use_release_build else "debug"
+    native_lib_build_dir = TARGET_DIR / native_lib_build_dir_name
     if use_existing_native_libs is None:
-        print("Building the native Java library...")
-        args = ["cargo", "build", "--package", "sysand-java"]
-        if use_release_build:
-            args.append("--release")
-        execute(args, cwd=BUILD_DIR)
+        native_lib_path = native_lib_build_dir / native_lib_name()
+        if native_lib_is_up_to_date(native_lib_path):
+            print(f"Native Java library {native_lib_path} is up to date")
+        else:
+            print("Building the native Java library...")
+            args = ["cargo", "build", "--package", "sysand-java"]
+            if use_release_build:
+                args.append("--release")
+            execute(args, cwd=BUILD_DIR)
 
     print("Copying the Java code to the target directory...")
-    shutil.copytree(ROOT_DIR / "bindings" / "java" / "java" / "src", BUILD_DIR / "src")
+    copy_tree(ROOT_DIR / "bindings" / "java" / "java" / "src", BUILD_DIR / "src")
 
     print("Copying the native libraries to the target directory...")
     native_lib_target_dir = BUILD_DIR / "src" / "main" / "resources"
     native_lib_target_dir.mkdir(parents=True, exist_ok=True)
-    native_lib_build_dir_name = "release" if use_release_build else "debug"
-    native_lib_build_dir = TARGET_DIR / native_lib_build_dir_name
     if use_existing_native_libs is None:
         # Used when compiling locally, most likely only one of the binaries will
         # be present.
@@ -221,73 +499,93 @@ def build(
             "windows",
             "arm64",
         )
-    for native_lib_build_path, os_name, arch_name in [
+    native_lib_build_paths = [
         native_lib_build_path_linux_x64_64,
         native_lib_build_path_linux_aarch64_arm64,
         native_lib_build_path_macos_arm64,
         native_lib_build_path_macos_x86_64,
         native_lib_build_path_windows_x64_64,
         native_lib_build_path_windows_aarch64_arm64,
-    ]:
-        if native_lib_build_path.exists():
+    ]
+    native_lib_copies: "list[tuple[Path, Path]]" = []
+    # Locally all the candidates share one directory, so list it once instead
+    # of probing every candidate path separately. In CI each candidate has a
+    # directory of its own, where a single probe is cheaper than a listing.
+    parent_counts = collections.Counter(
+        native_lib_build_path.parent
+        for native_lib_build_path, _, _ in native_lib_build_paths
+    )
+    dir_files: "dict[Path, set[str]]" = {}
+    for native_lib_build_path, os_name, arch_name in native_lib_build_paths:
+        parent_dir = native_lib_build_path.parent
+        if parent_counts[parent_dir] < 2:
+            is_present = native_lib_build_path.is_file()
+        else:
+            if parent_dir not in dir_files:
+                dir_files[parent_dir] = list_file_names(parent_dir)
+            is_present = native_lib_build_path.name in dir_files[parent_dir]
+        if is_present:
+            # Target directories are created up front so that the copies
+            # below do not race on `mkdir`.
             target_dir = native_lib_target_dir / f"{os_name}-{arch_name}"
             target_dir.mkdir(parents=True, exist_ok=True)
-            target_path = target_dir / native_lib_build_path.name
-            print(f"Copying {native_lib_build_path} to {target_path}")
-            shutil.copy2(native_lib_build_path, target_path)
+            native_lib_copies.append(
+                (native_lib_build_path, target_dir / native_lib_build_path.name)
+            )
         else:
             assert use_existing_native_libs is None, (
                 f"Missing native lib: {native_lib_build_path}"
             )
+    # The copies are independent and IO-bound, so run them concurrently.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=6) as executor:
+        futures = []
+        for source_path, target_path in native_lib_copies:
+            print(f"Copying {source_path} to {target_path}")
+            futures.append(executor.submit(copy_native_lib, source_path, target_path))
+        for future in concurrent.futures.as_completed(futures):
+            future.result()
 
     print(
         "Copying the `pom.xml` template to the target directory and replacing the version..."
     )
     pom_path = ROOT_DIR / "bindings" / "java" / "java" / "pom.xml"
-    pom_data = pom_path.read_text()
-    target_pom_path = BUILD_DIR / "pom.xml"
     full_version = compute_full_version(version, release_jar_version)
-    target_pom_data = pom_data.replace("VERSION", full_version)
-    target_pom_path.write_text(target_pom_data)
+    write_pom(pom_path, BUILD_DIR / "pom.xml", full_version)
 
     print("Building the JAR...")
-    mvn_args = [
-        mvn_executable(),
-        "clean",
-        "install",
-        "compile",
-        "assembly:single",
-        "-U",
-    ]
+    mvn_args = [mvn_executable(), *MVN_PARALLEL_ARGS]
+    if clean:
+        mvn_args.append("clean")
+    # `install` already runs the `compile` phase; `assembly:single` is not
+    # bound to any phase, so it has to be requested explicitly.
+    mvn_args.extend(["install", "assembly:single", "-U"])
     if not sign_artifacts:
         mvn_args.append("-Dgpg.skip=true")
     execute(mvn_args, cwd=BUILD_DIR)
 
 
 def build_plugin(sign_artifacts: bool, version: str, release_jar_version: bool) -> None:
-    print("Cleaning the target directory for the sysand Maven plugin...")
-    shutil.rmtree(PLUGIN_DIR, ignore_errors=True)
+    # Maven's output also depends on the sysand JAR and the version, and the
+    # invoker plugin does not clean the integration tests it copies into
+    # `target/it`, so only the copy of the sources is reused between runs.
+    print("Cleaning the Maven output of the sysand Maven plugin...")
+    shutil.rmtree(PLUGIN_DIR / "target", ignore_errors=True)
     PLUGIN_DIR.mkdir(parents=True, exist_ok=True)
 
     print(
         "Copying the Java code to the target directory for the sysand Maven plugin..."
     )
-    shutil.copytree(
-        ROOT_DIR / "bindings" / "java" / "plugin" / "src", PLUGIN_DIR / "src"
-    )
+    sync_tree(ROOT_DIR / "bindings" / "java" / "plugin" / "src", PLUGIN_DIR / "src")
 
     print(
         "Copying the `pom.xml` template to the target directory and replacing the version..."
     )
     pom_path = ROOT_DIR / "bindings" / "java" / "plugin" / "pom.xml"
-    pom_data = pom_path.read_text()
-    target_pom_path = PLUGIN_DIR / "pom.xml"
     full_version = compute_full_version(version, release_jar_version)
-    target_pom_data = pom_data.replace("VERSION", full_version)
-    target_pom_path.write_text(target_pom_data)
+    write_pom(pom_path, PLUGIN_DIR / "pom.xml", full_version)
 
     print("Building the sysand Maven plugin...")
-    mvn_args = [mvn_executable(), "-B", "-DskipTests=false"]
+    mvn_args = [mvn_executable(), *MVN_PARALLEL_ARGS, "-B", "-DskipTests=false"]
     if not sign_artifacts:
         mvn_args.append("-Dgpg.skip=true")
     mvn_args.append("verify")
@@ -317,20 +615,18 @@ def test_deployed(version: str, release_jar_version: bool) -> None:
     full_version = compute_full_version(version, release_jar_version)
 
     print("Copying the deploy test code to the target directory...")
-    shutil.rmtree(DEPLOY_TEST_DIR, ignore_errors=True)
-    shutil.copytree(
-        ROOT_DIR / "bindings" / "java" / "java-deploy-test", DEPLOY_TEST_DIR
+    sync_tree(
+        ROOT_DIR / "bindings" / "java" / "java-deploy-test",
+        DEPLOY_TEST_DIR,
+        POM_TEMPLATE_EXCLUDE,
     )
 
     print("Replacing com.sensmetry.sysand dependency version in deploy test pom.xml")
     pom_path = ROOT_DIR / "bindings" / "java" / "java-deploy-test" / "pom.xml"
-    pom_data = pom_path.read_text()
-    target_pom_path = DEPLOY_TEST_DIR / "pom.xml"
-    target_pom_data = pom_data.replace("VERSION", full_version)
-    target_pom_path.write_text(target_pom_data)
+    write_pom(pom_path, DEPLOY_TEST_DIR / "pom.xml", full_version)
 
     print("Testing the deployed Java library...")
-    execute([mvn_executable(), "test"], cwd=DEPLOY_TEST_DIR)
+    execute([mvn_executable(), *MVN_PARALLEL_ARGS, "test"], cwd=DEPLOY_TEST_DIR)
 
 
 def test(version: str, release_jar_version: bool) -> None:
@@ -347,18 +643,16 @@ def test(version: str, release_jar_version: bool) -> None:
         )
 
     print("Copying the test code to the target directory...")
-    shutil.rmtree(TEST_DIR, ignore_errors=True)
-    shutil.copytree(ROOT_DIR / "bindings" / "java" / "java-test", TEST_DIR)
+    sync_tree(
+        ROOT_DIR / "bindings" / "java" / "java-test", TEST_DIR, POM_TEMPLATE_EXCLUDE
+    )
 
     print("Replacing com.sensmetry.sysand dependency version in test pom.xml")
     pom_path = ROOT_DIR / "bindings" / "java" / "java-test" / "pom.xml"
-    pom_data = pom_path.read_text()
-    target_pom_path = TEST_DIR / "pom.xml"
-    target_pom_data = pom_data.replace("VERSION", full_version)
-    target_pom_path.write_text(target_pom_data)
+    write_pom(pom_path, TEST_DIR / "pom.xml", full_version)
 
     print("Testing the Java library...")
-    execute([mvn_executable(), "test"], cwd=TEST_DIR)
+    execute([mvn_executable(), *MVN_PARALLEL_ARGS, "test"], cwd=TEST_DIR)
 
 
 def main() -> None:
@@ -380,6 +674,7 @@ def main() -> None:
             args.sign_artifacts,
             release_jar_version,
             version,
+            args.clean,
         )
     elif args.command == "build-plugin":
         build_plugin(args.sign_artifacts, version, release_jar_version)
@@ -1,45 +1,88 @@
 # SPDX-License-Identifier: MIT OR Apache-2.0
 # SPDX-FileCopyrightText: © 2025 Sysand contributors <opensource@sensmetry.com>
 
-from ._model import (
-    InterchangeProjectUsage,
-    InterchangeProjectInfo,
-    InterchangeProjectChecksum,
-    InterchangeProjectMetadata,
-    CompressionMethod,
-)
+from __future__ import annotations
 
-from ._info import info_path, info
+import importlib
+import typing
 
-from . import env
+if typing.TYPE_CHECKING:
+    from ._model import (
+        InterchangeProjectUsage,
+        InterchangeProjectInfo,
+        InterchangeProjectChecksum,
+        InterchangeProjectMetadata,
+        CompressionMethod,
+    )
 
-from ._init import (
-    init,
-)
+    from ._info import info_path, info
 
-from ._add import (
-    add,
-)
+    from . import env
 
+    from ._init import (
+        init,
+    )
 
-from ._remove import (
-    remove,
-)
+    from ._add import (
+        add,
+    )
 
-from ._include import (
-    include,
-)
+    from ._remove import (
+        remove,
+    )
 
-from ._exclude import (
-    exclude,
-)
+    from ._include import (
+        include,
+    )
 
+    from ._exclude import (
+        exclude,
+    )
 
-from ._sources import (
-    sources,
-)
+    from ._sources import (
+        sources,
+        sources_many,
+    )
+
+    from ._build import build
+
+# Most submodules load the native extension, so they are only imported when
+# one of their attributes is first accessed (PEP 562)
+_LAZY_ATTRIBUTES = {
+    "InterchangeProjectUsage": "._model",
+    "InterchangeProjectInfo": "._model",
+    "InterchangeProjectChecksum": "._model",
+    "InterchangeProjectMetadata": "._model",
+    "CompressionMethod": "._model",
+    "info_path": "._info",
+    "info": "._info",
+    "env": ".env",
+    "init": "._init",
+    "add": "._add",
+    "remove": "._remove",
+    "include": "._include",
+    "exclude": "._exclude",
+    "sources": "._sources",
+    "sources_many": "._sources",
+    "build": "._build",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name, __name__)
+    value = module if module_name == f".{name}" else getattr(module, name)
+    # Cache on the package so that later lookups bypass `__getattr__`
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(__all__))
 
-from ._build import build
 
 __all__ = [
     "InterchangeProjectUsage",
@@ -66,4 +109,5 @@ __all__ = [
     "exclude",
     ## Sources
     "sources",
+    "sources_many",
 ]
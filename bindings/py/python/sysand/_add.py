@@ -3,13 +3,13 @@
 
 from __future__ import annotations
 
-import sysand._sysand_core as sysand_rs  # type: ignore
+from sysand._core import do_add_py
 
 from pathlib import Path
 
 
 def add(path: Path | str, iri: str, version: str | None = None) -> None:
-    sysand_rs.do_add_py(str(path), iri, version)
+    do_add_py(path, iri, version)
 
 
 __all__ = ["add"]
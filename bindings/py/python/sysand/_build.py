@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 from sysand._model import CompressionMethod
-import sysand._sysand_core as sysand_rs  # type: ignore
+from sysand._core import do_build_py
 
 from pathlib import Path
 
@@ -14,12 +14,9 @@ def build(
     project_path: str | Path | None = None,
     compression: CompressionMethod | None = None,
 ) -> None:
-    if project_path is not None:
-        project_path = str(project_path)
-
     # comp = None if compression is None else _convert_compression(compression)
     comp = None if compression is None else compression.name
-    sysand_rs.do_build_py(str(output_path), project_path, comp)
+    do_build_py(output_path, project_path, comp)
 
 
 __all__ = [
@@ -0,0 +1,41 @@
+# SPDX-License-Identifier: MIT OR Apache-2.0
+# SPDX-FileCopyrightText: © 2026 Sysand contributors <opensource@sensmetry.com>
+
+# The only module that imports the native extension directly; everything else
+# in the package goes through here
+
+from sysand._sysand_core import (  # type: ignore
+    DEFAULT_ENV_NAME,
+    _run_cli,
+    do_add_py,
+    do_build_py,
+    do_env_install_path_py,
+    do_env_py_local_dir,
+    do_exclude_py,
+    do_include_py,
+    do_info_py,
+    do_info_py_path,
+    do_init_py_local_file,
+    do_remove_py,
+    do_sources_env_py,
+    do_sources_many_py,
+    do_sources_project_py,
+)
+
+__all__ = [
+    "DEFAULT_ENV_NAME",
+    "_run_cli",
+    "do_add_py",
+    "do_build_py",
+    "do_env_install_path_py",
+    "do_env_py_local_dir",
+    "do_exclude_py",
+    "do_include_py",
+    "do_info_py",
+    "do_info_py_path",
+    "do_init_py_local_file",
+    "do_remove_py",
+    "do_sources_env_py",
+    "do_sources_many_py",
+    "do_sources_project_py",
+]
@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-import sysand._sysand_core as sysand_rs  # type: ignore
+from sysand._core import do_exclude_py
 
 from pathlib import Path
 
@@ -12,7 +12,7 @@ def exclude(
     path: Path | str,
     src_path: str | Path,
 ) -> None:
-    sysand_rs.do_exclude_py(str(path), str(src_path))
+    do_exclude_py(path, str(src_path))
 
 
 __all__ = ["exclude"]
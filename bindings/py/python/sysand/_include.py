@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-import sysand._sysand_core as sysand_rs  # type: ignore
+from sysand._core import do_include_py
 
 from pathlib import Path
 from typing import Literal
@@ -17,9 +17,7 @@ def include(
     index_symbols: bool = True,
     force_format: Literal["sysml", "kerml"] | None = None,
 ) -> None:
-    sysand_rs.do_include_py(
-        str(path), str(src_path), compute_checksum, index_symbols, force_format
-    )
+    do_include_py(path, str(src_path), compute_checksum, index_symbols, force_format)
 
 
 __all__ = ["include"]
@@ -5,7 +5,7 @@ from __future__ import annotations
 
 from ._model import InterchangeProjectInfo, InterchangeProjectMetadata
 
-import sysand._sysand_core as sysand_rs  # type: ignore
+from sysand._core import do_info_py, do_info_py_path
 
 import typing
 from pathlib import Path
@@ -15,7 +15,7 @@ from os import getcwd
 def info_path(
     path: str | Path = ".",
 ) -> typing.Tuple[InterchangeProjectInfo, InterchangeProjectMetadata]:
-    return sysand_rs.do_info_py_path(str(path))  # type: ignore
+    return do_info_py_path(path)  # type: ignore
 
 
 def info(
@@ -30,7 +30,7 @@ def info(
     if isinstance(index_urls, str):
         index_urls = [index_urls]
 
-    return sysand_rs.do_info_py(uri, relative_file_root, index_urls)  # type: ignore
+    return do_info_py(uri, relative_file_root, index_urls)  # type: ignore
 
 
 __all__ = [
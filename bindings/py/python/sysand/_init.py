@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-import sysand._sysand_core as sysand_rs  # type: ignore
+from sysand._core import do_init_py_local_file
 
 from pathlib import Path
 
@@ -12,7 +12,7 @@ def init(name: str, publisher: str, version: str, path: str | Path = ".") -> Non
     if not Path(path).exists():
         Path(path).mkdir()
 
-    sysand_rs.do_init_py_local_file(name, publisher, version, str(path))
+    do_init_py_local_file(name, publisher, version, path)
 
 
 __all__ = ["init"]
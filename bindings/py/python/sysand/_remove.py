@@ -3,13 +3,13 @@
 
 from __future__ import annotations
 
-import sysand._sysand_core as sysand_rs  # type: ignore
+from sysand._core import do_remove_py
 
 from pathlib import Path
 
 
 def remove(path: Path | str, iri: str) -> None:
-    sysand_rs.do_remove_py(str(path), iri)
+    do_remove_py(path, iri)
 
 
 __all__ = ["remove"]
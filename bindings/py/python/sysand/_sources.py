@@ -2,10 +2,10 @@
 # SPDX-FileCopyrightText: © 2025 Sysand contributors <opensource@sensmetry.com>
 
 from __future__ import annotations
-from typing import List
+from typing import Iterable, List
 from pathlib import Path
 
-import sysand._sysand_core as sysand_rs  # type: ignore
+from sysand._core import do_sources_many_py, do_sources_project_py
 
 
 def sources(
@@ -14,15 +14,30 @@ def sources(
     include_deps: bool = True,
     env_path: str | Path | None = None,
     include_std: bool = False,
-) -> List[Path]:
-    if env_path is not None:
-        env_path = str(env_path)
+) -> List[str]:
+    # The environment is only read for dependencies, don't convert its path otherwise
+    if not include_deps:
+        env_path = None
+    return do_sources_project_py(  # type: ignore
+        path, include_deps, env_path, include_std
+    )
+
 
-    return sysand_rs.do_sources_project_py(  # type: ignore
-        str(path), include_deps, env_path, include_std
+def sources_many(
+    paths: Iterable[str | Path],
+    *,
+    include_deps: bool = True,
+    env_path: str | Path | None = None,
+    include_std: bool = False,
+) -> List[List[str]]:
+    if not include_deps:
+        env_path = None
+    return do_sources_many_py(  # type: ignore
+        list(paths), include_deps, env_path, include_std
     )
 
 
 __all__ = [
     "sources",
+    "sources_many",
 ]
@@ -3,8 +3,7 @@
 
 from __future__ import annotations
 
-import sysand._sysand_core as sysand_rs  # type: ignore
-from sysand._sysand_core import DEFAULT_ENV_NAME
+from sysand._core import DEFAULT_ENV_NAME, do_env_py_local_dir
 
 from ._install import (
     install_path,
@@ -14,7 +13,7 @@ from pathlib import Path
 
 
 def env(path: str | Path = DEFAULT_ENV_NAME) -> None:
-    sysand_rs.do_env_py_local_dir(str(path))
+    do_env_py_local_dir(path)
 
 
 __all__ = [
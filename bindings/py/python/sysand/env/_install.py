@@ -3,13 +3,13 @@
 
 from __future__ import annotations
 
-import sysand._sysand_core as sysand_rs  # type: ignore
+from sysand._core import do_env_install_path_py
 
 from pathlib import Path
 
 
 def install_path(env_path: str | Path, iri: str, location: str | Path) -> None:
-    sysand_rs.do_env_install_path_py(str(env_path), iri, str(location))
+    do_env_install_path_py(env_path, iri, location)
 
 
 __all__ = ["install_path"]
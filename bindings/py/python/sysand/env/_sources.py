@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import List
 from pathlib import Path
 
-import sysand._sysand_core as sysand_rs  # type: ignore
+from sysand._core import do_sources_env_py
 
 
 def sources(
@@ -15,9 +15,9 @@ def sources(
     *,
     include_deps: bool = True,
     include_std: bool = False,
-) -> List[Path]:
-    return sysand_rs.do_sources_env_py(  # type: ignore
-        str(env_path), iri, version, include_deps, include_std
+) -> List[str]:
+    return do_sources_env_py(  # type: ignore
+        env_path, iri, version, include_deps, include_std
     )
 
 
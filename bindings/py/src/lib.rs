@@ -1,12 +1,22 @@
 // SPDX-License-Identifier: MIT OR Apache-2.0
 // SPDX-FileCopyrightText: © 2025 Sysand contributors <opensource@sensmetry.com>
 
-use std::{collections::HashMap, iter, process::ExitCode, sync::Arc};
+use std::{
+    collections::HashMap,
+    iter,
+    num::NonZeroUsize,
+    path::PathBuf,
+    process::ExitCode,
+    sync::{Arc, LazyLock, Mutex, MutexGuard, PoisonError},
+    thread,
+    time::SystemTime,
+};
 
 use camino::{Utf8Path, Utf8PathBuf};
 use pyo3::{
     exceptions::{PyFileExistsError, PyFileNotFoundError, PyIOError, PyRuntimeError, PyValueError},
     prelude::*,
+    types::PyString,
 };
 use semver::{Version, VersionReq};
 use sysand_core::{
@@ -20,7 +30,8 @@ use sysand_core::{
     env::{
         DEFAULT_ENV_NAME, ReadEnvironment as _, WriteEnvironment,
         local_directory::{
-            LocalDirectoryEnvironment, LocalReadError, LocalWriteError, metadata::EnvMetadataError,
+            LocalDirectoryEnvironment, LocalReadError, LocalWriteError, METADATA_PATH,
+            metadata::EnvMetadataError,
         },
         utils::clone_project,
     },
@@ -33,10 +44,14 @@ use sysand_core::{
         ProjectRead as _,
         local_kpar::{KparInnerPath, LocalKParProject},
         local_src::{LocalSrcError, LocalSrcProject},
+        memory::InMemoryProject,
         utils::wrapfs,
     },
     remove::do_remove_guess,
-    resolve::{net_utils::create_reqwest_client, standard::standard_resolver},
+    resolve::{
+        net_utils::{JsonCache, create_reqwest_client},
+        standard::standard_resolver_with_json_cache,
+    },
     sources::{do_sources_local_src_project_no_deps, find_project_dependencies},
     stdlib::known_std_libs,
     symbols::Language,
@@ -58,7 +73,7 @@ fn do_init_py_local_file(
     name: String,
     publisher: Option<String>,
     version: String,
-    path: String,
+    path: FsPath,
     license: Option<String>,
 ) -> PyResult<()> {
     // Initialize logger in each function independently to avoid setting up a
@@ -67,25 +82,23 @@ fn do_init_py_local_file(
     // library from python runs it
     let _ = pyo3_log::try_init();
 
-    do_init_local_file(name, publisher, version, license, Utf8PathBuf::from(path)).map_err(
-        |err| {
-            let e = format_err(&err);
-            match err {
-                InitError::SemVerParse(..) => PyValueError::new_err(e),
-                InitError::SPDXLicenseParse(..) => PyValueError::new_err(e),
-                InitError::Project(err) => match err {
-                    LocalSrcError::AlreadyExists(_) => PyFileExistsError::new_err(e),
-                    LocalSrcError::Deserialize(_) => PyValueError::new_err(e),
-                    LocalSrcError::Io(_) => PyIOError::new_err(e),
-                    LocalSrcError::Path(_) => PyIOError::new_err(e),
-                    LocalSrcError::Serialize(_) => PyValueError::new_err(e),
-                    LocalSrcError::ImpossibleRelativePath(_) => PyValueError::new_err(e),
-                    LocalSrcError::MissingMeta => PyFileNotFoundError::new_err(e),
-                    LocalSrcError::MissingInfoMeta => PyFileNotFoundError::new_err(e),
-                },
-            }
-        },
-    )?;
+    do_init_local_file(name, publisher, version, license, path.0).map_err(|err| {
+        let e = format_err(&err);
+        match err {
+            InitError::SemVerParse(..) => PyValueError::new_err(e),
+            InitError::SPDXLicenseParse(..) => PyValueError::new_err(e),
+            InitError::Project(err) => match err {
+                LocalSrcError::AlreadyExists(_) => PyFileExistsError::new_err(e),
+                LocalSrcError::Deserialize(_) => PyValueError::new_err(e),
+                LocalSrcError::Io(_) => PyIOError::new_err(e),
+                LocalSrcError::Path(_) => PyIOError::new_err(e),
+                LocalSrcError::Serialize(_) => PyValueError::new_err(e),
+                LocalSrcError::ImpossibleRelativePath(_) => PyValueError::new_err(e),
+                LocalSrcError::MissingMeta => PyFileNotFoundError::new_err(e),
+                LocalSrcError::MissingInfoMeta => PyFileNotFoundError::new_err(e),
+            },
+        }
+    })?;
 
     Ok(())
 }
@@ -94,10 +107,12 @@ fn do_init_py_local_file(
 #[pyo3(
     signature = (path),
 )]
-fn do_env_py_local_dir(path: String) -> PyResult<()> {
+fn do_env_py_local_dir(path: FsPath) -> PyResult<()> {
     let _ = pyo3_log::try_init();
 
-    do_env_local_dir(Utf8Path::new(&path)).map_err(|err| {
+    let path = path.0;
+    forget_cached_env(&path);
+    do_env_local_dir(path).map_err(|err| {
         let e = format_err(&err);
         match err {
             EnvError::AlreadyExists(_) => PyFileExistsError::new_err(e),
@@ -126,13 +141,13 @@ fn do_env_py_local_dir(path: String) -> PyResult<()> {
     signature = (path),
 )]
 fn do_info_py_path(
-    path: String,
+    path: FsPath,
 ) -> PyResult<(InterchangeProjectInfoRaw, InterchangeProjectMetadataRaw)> {
     let _ = pyo3_log::try_init();
 
     let project = LocalSrcProject {
         nominal_path: None,
-        project_path: path.into(),
+        project_path: path.0,
         expected_checksum: None,
     };
 
@@ -147,6 +162,11 @@ fn do_info_py_path(
     }
 }
 
+/// JSON documents fetched by earlier calls. Every call builds a new resolver,
+/// so the cache is kept here to let repeated calls revalidate instead of
+/// downloading the documents again
+static JSON_CACHE: LazyLock<Arc<JsonCache>> = LazyLock::new(Default::default);
+
 #[pyfunction(name = "do_info_py")]
 #[pyo3(
     signature = (uri, relative_file_root, index_urls),
@@ -154,7 +174,7 @@ fn do_info_py_path(
 fn do_info_py(
     py: Python,
     uri: String,
-    relative_file_root: String,
+    relative_file_root: FsPath,
     index_urls: Option<Vec<String>>,
 ) -> PyResult<(InterchangeProjectInfoRaw, InterchangeProjectMetadataRaw)> {
     let _ = pyo3_log::try_init();
@@ -178,14 +198,15 @@ fn do_info_py(
             .transpose()
             .map_err(|err| PyValueError::new_err(format_err(err)))?;
 
-        let combined_resolver = standard_resolver(
-            Some(relative_file_root.into()),
+        let combined_resolver = standard_resolver_with_json_cache(
+            Some(relative_file_root.0),
             None,
             Some(client),
             index_url,
             runtime,
             // FIXME: Add Python support for authentication
             Arc::new(Unauthenticated {}),
+            JSON_CACHE.clone(),
         )
         .map_err(|err| PyValueError::new_err(format_err(err)))?;
 
@@ -206,18 +227,19 @@ fn do_info_py(
     signature = (output_path, project_path, compression),
 )]
 fn do_build_py(
-    output_path: String,
-    project_path: Option<String>,
+    output_path: FsPath,
+    project_path: Option<FsPath>,
     compression: Option<String>,
 ) -> PyResult<()> {
     let _ = pyo3_log::try_init();
 
+    let output_path = output_path.0;
     let Some(current_project_path) = project_path else {
         return Err(pyo3::exceptions::PyNotImplementedError::new_err("TODO"));
     };
     let project = LocalSrcProject {
         nominal_path: None,
-        project_path: current_project_path.into(),
+        project_path: current_project_path.0,
         expected_checksum: None,
     };
 
@@ -257,7 +279,8 @@ fn do_build_py(
     signature = (env_path, iri, version, include_deps, include_std),
 )]
 pub fn do_sources_env_py(
-    env_path: String,
+    py: Python,
+    env_path: FsPath,
     iri: String,
     version: Option<String>,
     include_deps: bool,
@@ -265,77 +288,210 @@ pub fn do_sources_env_py(
 ) -> PyResult<Vec<String>> {
     let _ = pyo3_log::try_init();
 
-    let provided_iris = if !include_std {
-        known_std_libs()
-    } else {
-        HashMap::default()
-    };
-
-    let version = match version {
-        Some(version) => Some(
-            VersionReq::parse(&version).map_err(|err| PyValueError::new_err(format_err(err)))?,
-        ),
-        None => None,
-    };
+    py.detach(|| {
+        let provided_iris = if !include_std {
+            known_std_libs()
+        } else {
+            HashMap::default()
+        };
 
-    let mut result = vec![];
+        let version = match version {
+            Some(version) => Some(
+                VersionReq::parse(&version)
+                    .map_err(|err| PyValueError::new_err(format_err(err)))?,
+            ),
+            None => None,
+        };
 
-    let env = LocalDirectoryEnvironment::read(env_path).map_err(env_read_to_pyerr)?;
+        let env = read_env_cached(env_path.0)?;
 
-    fn local_read_to_pyerr(err: LocalReadError) -> PyErr {
-        let e = format_err(&err);
-        match err {
-            LocalReadError::Io(_) => PyIOError::new_err(e),
-            LocalReadError::ProjectNotFound(_) => PyValueError::new_err(e),
+        fn local_read_to_pyerr(err: LocalReadError) -> PyErr {
+            let e = format_err(&err);
+            match err {
+                LocalReadError::Io(_) => PyIOError::new_err(e),
+                LocalReadError::ProjectNotFound(_) => PyValueError::new_err(e),
+            }
         }
-    }
 
-    let mut projects = env
-        .candidate_projects(&iri)
-        .map_err(local_read_to_pyerr)?
-        .into_iter();
-
-    let Some(project) = (match &version {
-        None => projects.next(),
-        Some(vr) => loop {
-            if let Some(candidate) = projects.next() {
-                if let Some(v) = candidate
-                    .version()
-                    .map_err(|e| PyRuntimeError::new_err(format_err(e)))?
-                    .and_then(|x| Version::parse(&x).ok())
-                    && vr.matches(&v)
-                {
-                    break Some(candidate);
+        let mut projects = env
+            .candidate_projects(&iri)
+            .map_err(local_read_to_pyerr)?
+            .into_iter();
+
+        let Some(project) = (match &version {
+            None => projects.next(),
+            Some(vr) => loop {
+                if let Some(candidate) = projects.next() {
+                    if let Some(v) = candidate
+                        .version()
+                        .map_err(|e| PyRuntimeError::new_err(format_err(e)))?
+                        .and_then(|x| Version::parse(&x).ok())
+                        && vr.matches(&v)
+                    {
+                        break Some(candidate);
+                    }
+                } else {
+                    break None;
+                }
+            },
+        }) else {
+            match version {
+                Some(vr) => {
+                    return Err(PyRuntimeError::new_err(format!(
+                        "unable to find project `{}` ({}) in local environment",
+                        iri, vr
+                    )));
+                }
+                None => {
+                    return Err(PyRuntimeError::new_err(format!(
+                        "unable to find project `{}` in local environment",
+                        iri
+                    )));
                 }
-            } else {
-                break None;
-            }
-        },
-    }) else {
-        match version {
-            Some(vr) => {
-                return Err(PyRuntimeError::new_err(format!(
-                    "unable to find project `{}` ({}) in local environment",
-                    iri, vr
-                )));
-            }
-            None => {
-                return Err(PyRuntimeError::new_err(format!(
-                    "unable to find project `{}` in local environment",
-                    iri
-                )));
             }
+        };
+
+        let mut result = project_sources(&project)?;
+
+        if include_deps {
+            let Some(info) = project
+                .get_info()
+                .map_err(|e| PyRuntimeError::new_err(format_err(e)))?
+            else {
+                return Err(PyRuntimeError::new_err(
+                    "project is missing project information",
+                ));
+            };
+
+            let deps = find_project_dependencies(
+                info.validate()
+                    .map_err(|e| PyRuntimeError::new_err(format_err(e)))?
+                    .usage,
+                env,
+                &provided_iris,
+            )
+            .map_err(|e| PyRuntimeError::new_err(format_err(e)))?;
+
+            result.extend(dependency_sources(&deps)?);
         }
-    };
 
-    for src_path in do_sources_local_src_project_no_deps(&project, true)
+        Ok(result)
+    })
+}
+
+/// Sources of a single project, without its dependencies. Collecting straight
+/// from the listed paths reuses their buffer, since `Utf8PathBuf` and `String`
+/// have the same layout
+fn project_sources(project: &LocalSrcProject) -> PyResult<Vec<String>> {
+    Ok(do_sources_local_src_project_no_deps(project, true)
         .map_err(|e| PyRuntimeError::new_err(format_err(e)))?
-    {
-        result.push(src_path.into_string());
+        .into_iter()
+        .map(Utf8PathBuf::into_string)
+        .collect())
+}
+
+/// Below this many dependencies spawning threads costs more than listing
+/// the sources serially
+const PARALLEL_SOURCES_MIN_DEPS: usize = 4;
+
+/// Upper bound on the number of threads used to list dependency sources.
+/// Unset, empty or invalid values fall back to `available_parallelism()`
+const SYSAND_SOURCES_THREADS: &str = "SYSAND_SOURCES_THREADS";
+
+/// Number of threads to list the sources of `dep_count` dependencies with
+fn sources_threads(dep_count: usize) -> usize {
+    if dep_count < PARALLEL_SOURCES_MIN_DEPS {
+        return 1;
+    }
+    let available = thread::available_parallelism().map_or(1, NonZeroUsize::get);
+    let cap = std::env::var(SYSAND_SOURCES_THREADS)
+        .ok()
+        .and_then(|threads| threads.trim().parse::<NonZeroUsize>().ok())
+        .map_or(available, NonZeroUsize::get);
+    available.min(cap).min(dep_count)
+}
+
+/// Sources of all `deps`, in order. Listing a dependency only reads its own
+/// files, so with enough dependencies the work is split over scoped threads
+fn dependency_sources(deps: &[LocalSrcProject]) -> PyResult<Vec<String>> {
+    let threads = sources_threads(deps.len());
+
+    let per_dep = if threads <= 1 {
+        deps.iter()
+            .map(project_sources)
+            .collect::<PyResult<Vec<_>>>()?
+    } else {
+        thread::scope(|scope| {
+            let workers: Vec<_> = deps
+                .chunks(deps.len().div_ceil(threads))
+                .map(|chunk| {
+                    scope.spawn(move || {
+                        chunk
+                            .iter()
+                            .map(project_sources)
+                            .collect::<PyResult<Vec<_>>>()
+                    })
+                })
+                .collect();
+
+            let mut per_dep = Vec::with_capacity(deps.len());
+            for worker in workers {
+                per_dep.extend(worker.join().map_err(|_| {
+                    PyRuntimeError::new_err("listing dependency sources panicked")
+                })??);
+            }
+            PyResult::Ok(per_dep)
+        })?
+    };
+
+    let mut result = Vec::with_capacity(per_dep.iter().map(Vec::len).sum());
+    for sources in per_dep {
+        result.extend(sources);
+    }
+    Ok(result)
+}
+
+/// Environment and provided IRIs used to resolve project dependencies.
+/// Read once and shared by all projects whose sources are requested
+struct SourcesDeps {
+    env: LocalDirectoryEnvironment,
+    provided_iris: HashMap<String, Vec<InMemoryProject>>,
+}
+
+impl SourcesDeps {
+    fn read(env_path: Option<FsPath>, include_std: bool) -> PyResult<Self> {
+        let Some(env_path) = env_path else {
+            return Err(PyRuntimeError::new_err(
+                "unable to identify local environment",
+            ));
+        };
+
+        let provided_iris = if !include_std {
+            known_std_libs()
+        } else {
+            HashMap::default()
+        };
+
+        let env = read_env_cached(env_path.0)?;
+
+        Ok(Self { env, provided_iris })
     }
+}
+
+/// Sources of the project at `path`, followed by sources of its
+/// dependencies if `deps` is given
+fn local_project_sources(path: FsPath, deps: Option<&SourcesDeps>) -> PyResult<Vec<String>> {
+    let current_project = LocalSrcProject {
+        nominal_path: None,
+        project_path: path.0,
+        expected_checksum: None,
+    };
 
-    if include_deps {
-        let Some(info) = project
+    let mut result = project_sources(&current_project)?;
+
+    if let Some(deps) = deps {
+        // TODO: Better bail early?
+        let Some(info) = current_project
             .get_info()
             .map_err(|e| PyRuntimeError::new_err(format_err(e)))?
         else {
@@ -344,21 +500,16 @@ pub fn do_sources_env_py(
             ));
         };
 
-        for dep in find_project_dependencies(
+        let deps = find_project_dependencies(
             info.validate()
                 .map_err(|e| PyRuntimeError::new_err(format_err(e)))?
                 .usage,
-            env,
-            &provided_iris,
+            deps.env.clone(),
+            &deps.provided_iris,
         )
-        .map_err(|e| PyRuntimeError::new_err(format_err(e)))?
-        {
-            for src_path in do_sources_local_src_project_no_deps(&dep, true)
-                .map_err(|e| PyRuntimeError::new_err(format_err(e)))?
-            {
-                result.push(src_path.into_string());
-            }
-        }
+        .map_err(|e| PyRuntimeError::new_err(format_err(e)))?;
+
+        result.extend(dependency_sources(&deps)?);
     }
 
     Ok(result)
@@ -369,82 +520,64 @@ pub fn do_sources_env_py(
     signature = (path, include_deps, env_path, include_std),
 )]
 pub fn do_sources_project_py(
-    path: String,
+    py: Python,
+    path: FsPath,
     include_deps: bool,
-    env_path: Option<String>,
+    env_path: Option<FsPath>,
     include_std: bool,
 ) -> PyResult<Vec<String>> {
     let _ = pyo3_log::try_init();
 
-    let mut result = vec![];
-
-    let current_project = LocalSrcProject {
-        nominal_path: None,
-        project_path: path.into(),
-        expected_checksum: None,
-    };
-
-    for src_path in do_sources_local_src_project_no_deps(&current_project, true)
-        .map_err(|e| PyRuntimeError::new_err(format_err(e)))?
-    {
-        result.push(src_path.into_string());
-    }
-
-    if include_deps {
-        // TODO: Better bail early?
-        let Some(info) = current_project
-            .get_info()
-            .map_err(|e| PyRuntimeError::new_err(format_err(e)))?
-        else {
-            return Err(PyRuntimeError::new_err(
-                "project is missing project information",
-            ));
+    py.detach(|| {
+        let deps = if include_deps {
+            Some(SourcesDeps::read(env_path, include_std)?)
+        } else {
+            None
         };
 
-        let Some(env_path) = env_path else {
-            return Err(PyRuntimeError::new_err(
-                "unable to identify local environment",
-            ));
-        };
+        local_project_sources(path, deps.as_ref())
+    })
+}
 
-        let provided_iris = if !include_std {
-            known_std_libs()
+/// Same as `do_sources_project_py` for each of `paths`, but the environment
+/// is only read once
+#[pyfunction(name = "do_sources_many_py")]
+#[pyo3(
+    signature = (paths, include_deps, env_path, include_std),
+)]
+pub fn do_sources_many_py(
+    py: Python,
+    paths: Vec<FsPath>,
+    include_deps: bool,
+    env_path: Option<FsPath>,
+    include_std: bool,
+) -> PyResult<Vec<Vec<String>>> {
+    let _ = pyo3_log::try_init();
+
+    py.detach(|| {
+        let deps = if include_deps {
+            Some(SourcesDeps::read(env_path, include_std)?)
         } else {
-            HashMap::default()
+            None
         };
 
-        let env = LocalDirectoryEnvironment::read(env_path).map_err(env_read_to_pyerr)?;
-
-        for dep in find_project_dependencies(
-            info.validate()
-                .map_err(|e| PyRuntimeError::new_err(format_err(e)))?
-                .usage,
-            env,
-            &provided_iris,
-        )
-        .map_err(|e| PyRuntimeError::new_err(format_err(e)))?
-        {
-            for src_path in do_sources_local_src_project_no_deps(&dep, true)
-                .map_err(|e| PyRuntimeError::new_err(format_err(e)))?
-            {
-                result.push(src_path.into_string());
-            }
-        }
-    }
-
-    Ok(result)
+        paths
+            .into_iter()
+            .map(|path| local_project_sources(path, deps.as_ref()))
+            .collect()
+    })
 }
 
 #[pyfunction(name = "do_add_py")]
 #[pyo3(
     signature = (path, iri, version),
 )]
-fn do_add_py(path: String, iri: String, version: Option<String>) -> PyResult<()> {
+fn do_add_py(path: FsPath, iri: String, version: Option<String>) -> PyResult<()> {
     let _ = pyo3_log::try_init();
 
     let mut project = LocalSrcProject {
         nominal_path: None,
-        project_path: path.into(),
+        project_path: path.0,
         expected_checksum: None,
     };
 
@@ -459,18 +592,20 @@ fn do_add_py(path: String, iri: String, version: Option<String>) -> PyResult<()>
 #[pyo3(
     signature = (path, iri),
 )]
-fn do_remove_py(path: String, iri: String) -> PyResult<()> {
+fn do_remove_py(py: Python, path: FsPath, iri: String) -> PyResult<()> {
     let _ = pyo3_log::try_init();
 
-    let mut project = LocalSrcProject {
-        nominal_path: None,
-        project_path: path.into(),
-        expected_checksum: None,
-    };
+    py.detach(|| {
+        let mut project = LocalSrcProject {
+            nominal_path: None,
+            project_path: path.0,
+            expected_checksum: None,
+        };
 
-    do_remove_guess(&mut project, iri).map_err(|e| PyRuntimeError::new_err(format_err(e)))?;
+        do_remove_guess(&mut project, iri).map_err(|e| PyRuntimeError::new_err(format_err(e)))?;
 
-    Ok(())
+        Ok(())
+    })
 }
 
 /// `src_path` must be relative to and under the project root
@@ -480,7 +615,7 @@ fn do_remove_py(path: String, iri: String) -> PyResult<()> {
     signature = (path, src_path, compute_checksum, index_symbols, force_format),
 )]
 fn do_include_py(
-    path: String,
+    path: FsPath,
     src_path: String,
     compute_checksum: bool,
     index_symbols: bool,
@@ -490,7 +625,7 @@ fn do_include_py(
 
     let mut project = LocalSrcProject {
         nominal_path: None,
-        project_path: path.into(),
+        project_path: path.0,
         expected_checksum: None,
     };
     let force_format = match force_format {
@@ -522,12 +657,12 @@ fn do_include_py(
 #[pyo3(
     signature = (path, src_path),
 )]
-fn do_exclude_py(path: String, src_path: String) -> PyResult<()> {
+fn do_exclude_py(path: FsPath, src_path: String) -> PyResult<()> {
     let _ = pyo3_log::try_init();
 
     let mut project = LocalSrcProject {
         nominal_path: None,
-        project_path: path.into(),
+        project_path: path.0,
         expected_checksum: None,
     };
     // TODO: print the whole error chain
@@ -541,66 +676,76 @@ fn do_exclude_py(path: String, src_path: String) -> PyResult<()> {
 #[pyo3(
     signature = (env_path, iri, location),
 )]
-fn do_env_install_path_py(env_path: String, iri: String, location: String) -> PyResult<()> {
+fn do_env_install_path_py(
+    py: Python,
+    env_path: FsPath,
+    iri: String,
+    location: FsPath,
+) -> PyResult<()> {
     let _ = pyo3_log::try_init();
 
-    let location: Utf8PathBuf = location.into();
+    py.detach(|| {
+        let location = location.0;
 
-    let mut env = LocalDirectoryEnvironment::read(env_path).map_err(env_read_to_pyerr)?;
+        let env_path = env_path.0;
+        let mut env = LocalDirectoryEnvironment::read(&env_path).map_err(env_read_to_pyerr)?;
+        // `env` is about to be modified, so drop any copy cached by earlier calls
+        forget_cached_env(&env_path);
 
-    let metadata =
-        wrapfs::metadata(&location).map_err(|e| PyErr::new::<PyIOError, _>(format_err(e)))?;
-    if metadata.is_file() {
-        let project = LocalKParProject::new(&location, KparInnerPath::Guess, None, None);
+        let metadata =
+            wrapfs::metadata(&location).map_err(|e| PyErr::new::<PyIOError, _>(format_err(e)))?;
+        if metadata.is_file() {
+            let project = LocalKParProject::new(&location, KparInnerPath::Guess, None, None);
 
-        let Some(version) = project
-            .version()
-            .map_err(|e| PyRuntimeError::new_err(format_err(e)))?
-        else {
-            return Err(PyRuntimeError::new_err(format!(
-                "project at `{}` lacks project information",
-                location
-            )));
-        };
+            let Some(version) = project
+                .version()
+                .map_err(|e| PyRuntimeError::new_err(format_err(e)))?
+            else {
+                return Err(PyRuntimeError::new_err(format!(
+                    "project at `{}` lacks project information",
+                    location
+                )));
+            };
 
-        let checksum = project
-            .checksum_canonical_variant()
+            let checksum = project
+                .checksum_canonical_variant()
+                .map_err(|e| PyRuntimeError::new_err(format_err(e)))?;
+            env.put_project(iri, version, Some(checksum), |to| {
+                clone_project(&project, to, true).map(|_| ())
+            })
             .map_err(|e| PyRuntimeError::new_err(format_err(e)))?;
-        env.put_project(iri, version, Some(checksum), |to| {
-            clone_project(&project, to, true).map(|_| ())
-        })
-        .map_err(|e| PyRuntimeError::new_err(format_err(e)))?;
-    } else if metadata.is_dir() {
-        let project = LocalSrcProject {
-            nominal_path: None,
-            project_path: location,
-            expected_checksum: None,
-        };
+        } else if metadata.is_dir() {
+            let project = LocalSrcProject {
+                nominal_path: None,
+                project_path: location,
+                expected_checksum: None,
+            };
+
+            let Some(version) = project
+                .version()
+                .map_err(|e| PyRuntimeError::new_err(format_err(e)))?
+            else {
+                return Err(PyRuntimeError::new_err(format!(
+                    "project at {} lacks project information",
+                    project.project_path
+                )));
+            };
+            let checksum = project
+                .checksum_canonical_variant()
+                .map_err(|e| PyRuntimeError::new_err(format_err(e)))?;
 
-        let Some(version) = project
-            .version()
-            .map_err(|e| PyRuntimeError::new_err(format_err(e)))?
-        else {
+            env.put_project(iri, version, Some(checksum), |to| {
+                clone_project(&project, to, true).map(|_| ())
+            })
+            .map_err(|e| PyRuntimeError::new_err(format_err(e)))?;
+        } else {
             return Err(PyRuntimeError::new_err(format!(
-                "project at {} lacks project information",
-                project.project_path
+                "unable to find project at `{location}`"
             )));
-        };
-        let checksum = project
-            .checksum_canonical_variant()
-            .map_err(|e| PyRuntimeError::new_err(format_err(e)))?;
-
-        env.put_project(iri, version, Some(checksum), |to| {
-            clone_project(&project, to, true).map(|_| ())
-        })
-        .map_err(|e| PyRuntimeError::new_err(format_err(e)))?;
-    } else {
-        return Err(PyRuntimeError::new_err(format!(
-            "unable to find project at `{location}`"
-        )));
-    }
+        }
 
-    Ok(())
+        Ok(())
+    })
 }
 
 #[pymodule(name = "_sysand_core")]
@@ -613,6 +758,7 @@ pub fn sysand_py(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(do_build_py, m)?)?;
     m.add_function(wrap_pyfunction!(do_sources_env_py, m)?)?;
     m.add_function(wrap_pyfunction!(do_sources_project_py, m)?)?;
+    m.add_function(wrap_pyfunction!(do_sources_many_py, m)?)?;
     m.add_function(wrap_pyfunction!(do_add_py, m)?)?;
     m.add_function(wrap_pyfunction!(do_remove_py, m)?)?;
     m.add_function(wrap_pyfunction!(do_include_py, m)?)?;
@@ -625,6 +771,70 @@ pub fn sysand_py(m: &Bound<'_, PyModule>) -> PyResult<()> {
     Ok(())
 }
 
+/// Path argument, accepted as `str` or any `os.PathLike` so that callers
+/// don't need a Python-side `str()` conversion. `str` is borrowed as UTF-8
+/// directly; other objects go through `os.fspath()` as for `PathBuf`
+struct FsPath(Utf8PathBuf);
+
+impl<'a, 'py> FromPyObject<'a, 'py> for FsPath {
+    type Error = PyErr;
+
+    fn extract(obj: Borrowed<'a, 'py, PyAny>) -> PyResult<Self> {
+        if obj.is_instance_of::<PyString>() {
+            return Ok(Self(Utf8PathBuf::from(obj.extract::<&str>()?)));
+        }
+        Utf8PathBuf::from_path_buf(obj.extract::<PathBuf>()?)
+            .map(Self)
+            .map_err(|path| {
+                PyValueError::new_err(format!("path `{}` is not valid UTF-8", path.display()))
+            })
+    }
+}
+
+type EnvCache = HashMap<Utf8PathBuf, (SystemTime, u64, LocalDirectoryEnvironment)>;
+
+/// Environments read by earlier calls, keyed by their canonical path and
+/// revalidated against the modification time and size of `env.toml`
+static ENV_CACHE: LazyLock<Mutex<EnvCache>> = LazyLock::new(Default::default);
+
+fn env_cache() -> MutexGuard<'static, EnvCache> {
+    ENV_CACHE.lock().unwrap_or_else(PoisonError::into_inner)
+}
+
+/// Same as `LocalDirectoryEnvironment::read`, but reuses the environment
+/// from an earlier call if its `env.toml` has not changed since
+fn read_env_cached(env_path: Utf8PathBuf) -> PyResult<LocalDirectoryEnvironment> {
+    let Ok(root_dir) = wrapfs::canonicalize_raw(&env_path) else {
+        // Let `read` produce the error
+        return LocalDirectoryEnvironment::read(env_path).map_err(env_read_to_pyerr);
+    };
+    let stamp = std::fs::metadata(root_dir.join(METADATA_PATH))
+        .and_then(|metadata| Ok((metadata.modified()?, metadata.len())))
+        .ok();
+
+    let cached = stamp.and_then(|(modified, len)| {
+        let (cached_modified, cached_len, env) = env_cache().get(&root_dir)?.clone();
+        ((cached_modified, cached_len) == (modified, len)).then_some(env)
+    });
+    if let Some(env) = cached {
+        // `read` would have warned
+        LocalDirectoryEnvironment::warn_if_old_sysand_env_present(&root_dir);
+        return Ok(env);
+    }
+
+    let env = LocalDirectoryEnvironment::read(&root_dir).map_err(env_read_to_pyerr)?;
+    if let Some((modified, len)) = stamp {
+        env_cache().insert(root_dir, (modified, len, env.clone()));
+    }
+    Ok(env)
+}
+
+fn forget_cached_env(env_path: &Utf8Path) {
+    if let Ok(root_dir) = wrapfs::canonicalize_raw(env_path) {
+        env_cache().remove(&root_dir);
+    }
+}
+
 fn env_read_to_pyerr(err: EnvMetadataError) -> PyErr {
     PyIOError::new_err(format!(
         "failed to read environment metadata: {}",
@@ -6,12 +6,16 @@ import tempfile
 from pathlib import Path
 import re
 import os
-from typing import List, Union
+from typing import List, Tuple, Union
 
 import pytest
 from pytest_httpserver import HTTPServer
 
 import sysand
+from sysand._core import _run_cli
+
+# UTC timestamp format of `created` in `.meta.json`
+CREATED_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z")
 
 
 def test_basic_init(caplog: pytest.LogCaptureFixture) -> None:
@@ -29,16 +33,14 @@ def test_basic_init(caplog: pytest.LogCaptureFixture) -> None:
                 "    Creating interchange project `test_basic_init`",
             )
         ]
-        with open(Path(tmpdirname) / ".project.json", "r") as f:
-            assert (
-                f.read()
-                == '{\n  "name": "test_basic_init",\n  "publisher": "a",\n  "version": "1.2.3"\n}\n'
-            )
-        with open(Path(tmpdirname) / ".meta.json", "r") as f:
-            assert re.match(
-                r'\{\n  "index": \{\},\n  "created": "\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z"\n}\n',
-                f.read(),
-            )
+        assert (
+            (Path(tmpdirname) / ".project.json").read_bytes()
+            == b'{\n  "name": "test_basic_init",\n  "publisher": "a",\n  "version": "1.2.3"\n}\n'
+        )
+        assert re.match(
+            rb'\{\n  "index": \{\},\n  "created": "\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z"\n}\n',
+            (Path(tmpdirname) / ".meta.json").read_bytes(),
+        )
 
 
 def test_basic_env() -> None:
@@ -105,7 +107,7 @@ def test_basic_info(caplog: pytest.LogCaptureFixture) -> None:
 
         assert meta["index"] == {}
         assert isinstance(meta["created"], str)
-        assert re.match(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$", meta["created"])
+        assert CREATED_RE.fullmatch(meta["created"])
         assert meta["metamodel"] is None
         assert meta["includes_derived"] is None
         assert meta["includes_implied"] is None
@@ -192,7 +194,7 @@ def test_index_info(caplog: pytest.LogCaptureFixture, httpserver: HTTPServer) ->
 
     assert meta["index"] == {}
     assert isinstance(meta["created"], str)
-    assert re.match(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$", meta["created"])
+    assert CREATED_RE.fullmatch(meta["created"])
     assert meta["metamodel"] is None
     assert meta["includes_derived"] is None
     assert meta["includes_implied"] is None
@@ -203,77 +205,216 @@ def compare_sources(
     sources: Union[List[Path], List[str]],
     expected_sources: Union[List[Path], List[str]],
 ) -> None:
-    assert len(sources) == len(expected_sources)
-    for source, expected_source in zip(sources, expected_sources):
-        assert os.path.samefile(source, expected_source), (
-            f"source: {source}, expected_source: {expected_source}"
-        )
+    def file_id(path: Union[Path, str]) -> Tuple[int, int]:
+        stat = os.stat(path)
+        return stat.st_dev, stat.st_ino
+
+    # Same check as `os.path.samefile` on each pair, with every path stat'ed once
+    assert [file_id(source) for source in sources] == [
+        file_id(expected_source) for expected_source in expected_sources
+    ], f"sources: {sources}, expected_sources: {expected_sources}"
 
 
 def test_end_to_end_install_sources() -> None:
-    with tempfile.TemporaryDirectory() as tmp_main:
-        with tempfile.TemporaryDirectory() as tmp_dep:
-            tmp_main = Path(tmp_main).resolve()
-            tmp_dep = Path(tmp_dep).resolve()
-            sysand.init("test_end_to_end_install_sources", "a", "1.2.3", tmp_main)
-            sysand.init("test_end_to_end_install_sources_dep", "a", "1.2.3", tmp_dep)
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        tmp_root = Path(tmpdirname).resolve()
+        tmp_main = tmp_root / "main"
+        tmp_dep = tmp_root / "dep"
+        tmp_main.mkdir()
+        tmp_dep.mkdir()
+        sysand.init("test_end_to_end_install_sources", "a", "1.2.3", tmp_main)
+        sysand.init("test_end_to_end_install_sources_dep", "a", "1.2.3", tmp_dep)
+
+        with open(Path(tmp_main) / "src.sysml", "w") as f:
+            f.write("package Src;")
 
-            with open(Path(tmp_main) / "src.sysml", "w") as f:
-                f.write("package Src;")
+        sysand.include(tmp_main, "src.sysml")
 
-            sysand.include(tmp_main, "src.sysml")
+        with open(Path(tmp_dep) / "src_dep.sysml", "w") as f:
+            f.write("package SrcDep;")
 
-            with open(Path(tmp_dep) / "src_dep.sysml", "w") as f:
-                f.write("package SrcDep;")
+        sysand.include(tmp_dep, "src_dep.sysml")
 
-            sysand.include(tmp_dep, "src_dep.sysml")
+        env_path = Path(tmp_main) / sysand.env.DEFAULT_ENV_NAME
 
-            env_path = Path(tmp_main) / sysand.env.DEFAULT_ENV_NAME
+        sysand.env.env(env_path)
 
-            sysand.env.env(env_path)
+        sysand.env.install_path(
+            env_path, "urn:kpar:test_end_to_end_install_sources_dep", tmp_dep
+        )
 
-            sysand.env.install_path(
-                env_path, "urn:kpar:test_end_to_end_install_sources_dep", tmp_dep
-            )
+        sysand.add(tmp_main, "urn:kpar:test_end_to_end_install_sources_dep", "1.2.3")
 
-            sysand.add(
-                tmp_main, "urn:kpar:test_end_to_end_install_sources_dep", "1.2.3"
-            )
+        compare_sources(
+            sysand.sources(tmp_main, include_deps=False),
+            [str(Path(tmp_main) / "src.sysml")],
+        )
+        compare_sources(
+            sysand.sources(tmp_dep, include_deps=False),
+            [str(Path(tmp_dep) / "src_dep.sysml")],
+        )
+        compare_sources(
+            sysand.sources(tmp_main, include_deps=True, env_path=env_path),
+            [
+                str(Path(tmp_main) / "src.sysml"),
+                str(
+                    env_path
+                    / "lib"
+                    / "kpar.test_end_to_end_install_sources_dep_1.2.3"
+                    / "src_dep.sysml"
+                ),
+            ],
+        )
 
-            compare_sources(
-                sysand.sources(tmp_main, include_deps=False),
-                [str(Path(tmp_main) / "src.sysml")],
-            )
-            compare_sources(
-                sysand.sources(tmp_dep, include_deps=False),
-                [str(Path(tmp_dep) / "src_dep.sysml")],
-            )
-            compare_sources(
-                sysand.sources(tmp_main, include_deps=True, env_path=env_path),
-                [
-                    str(Path(tmp_main) / "src.sysml"),
-                    str(
-                        env_path
-                        / "lib"
-                        / "kpar.test_end_to_end_install_sources_dep_1.2.3"
-                        / "src_dep.sysml"
-                    ),
-                ],
-            )
+        main_sources, dep_sources = sysand.sources_many(
+            [tmp_main, tmp_dep], include_deps=True, env_path=env_path
+        )
+        compare_sources(
+            main_sources,
+            [
+                str(Path(tmp_main) / "src.sysml"),
+                str(
+                    env_path
+                    / "lib"
+                    / "kpar.test_end_to_end_install_sources_dep_1.2.3"
+                    / "src_dep.sysml"
+                ),
+            ],
+        )
+        compare_sources(dep_sources, [str(Path(tmp_dep) / "src_dep.sysml")])
+
+        sysand.exclude(tmp_main, "src.sysml")
+
+        compare_sources(
+            sysand.sources(tmp_main, include_deps=True, env_path=env_path),
+            [
+                str(
+                    env_path
+                    / "lib"
+                    / "kpar.test_end_to_end_install_sources_dep_1.2.3"
+                    / "src_dep.sysml"
+                ),
+            ],
+        )
 
-            sysand.exclude(tmp_main, "src.sysml")
-
-            compare_sources(
-                sysand.sources(tmp_main, include_deps=True, env_path=env_path),
-                [
-                    str(
-                        env_path
-                        / "lib"
-                        / "kpar.test_end_to_end_install_sources_dep_1.2.3"
-                        / "src_dep.sysml"
-                    ),
-                ],
-            )
+
+class ProjectWithEnv:
+    """Project `name` with a single source file and an environment, plus
+    helpers to install dependencies into that environment"""
+
+    def __init__(
+        self, tmp_root: Path, name: str, dep_file_names: Tuple[str, ...]
+    ) -> None:
+        self.tmp_root = tmp_root
+        self.name = name
+        self.dep_file_names = dep_file_names
+        self.path = tmp_root / "main"
+        self.path.mkdir()
+        sysand.init(name, "a", "1.2.3", self.path)
+        (self.path / "src.sysml").write_text("package Src;")
+        sysand.include(self.path, "src.sysml")
+
+        self.env_path = self.path / sysand.env.DEFAULT_ENV_NAME
+        sysand.env.env(self.env_path)
+
+    def create_dep(self, i: int) -> Tuple[str, Path]:
+        """Create dependency project number `i`; return its IRI and path"""
+        name = f"{self.name}_dep{i}"
+        dep_path = self.tmp_root / name
+        dep_path.mkdir()
+        sysand.init(name, "a", "1.2.3", dep_path)
+        for file_name in self.dep_file_names:
+            (dep_path / file_name).write_text(f"package Dep{i};")
+            sysand.include(dep_path, file_name)
+        return f"urn:kpar:{name}", dep_path
+
+    def install_dep(self, iri: str, dep_path: Path) -> None:
+        sysand.env.install_path(self.env_path, iri, dep_path)
+        sysand.add(self.path, iri, "1.2.3")
+
+    def check_sources(self, iris: List[str]) -> None:
+        """Check that `sources` lists the project's own source followed by
+        exactly the sources of the installed dependencies `iris`"""
+        sources = sysand.sources(self.path, include_deps=True, env_path=self.env_path)
+        expected_dep_sources = [
+            self.env_path
+            / "lib"
+            / f"kpar.{iri.removeprefix('urn:kpar:')}_1.2.3"
+            / file_name
+            for iri in iris
+            for file_name in self.dep_file_names
+        ]
+
+        # Dependencies follow in resolution order, which is unspecified
+        assert len(sources) == 1 + len(expected_dep_sources)
+        compare_sources(sources[:1], [self.path / "src.sysml"])
+        assert sorted(str(Path(source).resolve()) for source in sources[1:]) == sorted(
+            str(source.resolve()) for source in expected_dep_sources
+        )
+
+
+@pytest.mark.parametrize("sources_threads", [None, "1", "2"])
+def test_sources_many_deps(
+    monkeypatch: pytest.MonkeyPatch, sources_threads: Union[str, None]
+) -> None:
+    if sources_threads is None:
+        monkeypatch.delenv("SYSAND_SOURCES_THREADS", raising=False)
+    else:
+        monkeypatch.setenv("SYSAND_SOURCES_THREADS", sources_threads)
+
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        project = ProjectWithEnv(
+            Path(tmpdirname).resolve(),
+            "test_sources_many_deps",
+            ("a.sysml", "b.sysml"),
+        )
+
+        # Enough dependencies to list their sources in parallel
+        iris = []
+        for i in range(5):
+            iri, dep_path = project.create_dep(i)
+            project.install_dep(iri, dep_path)
+            iris.append(iri)
+
+        project.check_sources(iris)
+
+
+def test_sources_sees_env_changes(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Environments are cached between calls, so every kind of change to the
+    # environment must show up in the next `sources` call
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        project = ProjectWithEnv(
+            Path(tmpdirname).resolve(),
+            "test_sources_sees_env_changes",
+            ("src_dep.sysml",),
+        )
+
+        iri0, dep_path0 = project.create_dep(0)
+        project.install_dep(iri0, dep_path0)
+        project.check_sources([iri0])
+
+        # Installed through the bindings
+        iri1, dep_path1 = project.create_dep(1)
+        project.install_dep(iri1, dep_path1)
+        project.check_sources([iri0, iri1])
+
+        # Installed through the CLI, which knows nothing about the cache
+        iri2, dep_path2 = project.create_dep(2)
+        sysand.add(project.path, iri2, "1.2.3")
+        monkeypatch.chdir(project.path)
+        assert _run_cli(
+            [
+                "sysand",
+                "env",
+                "install",
+                iri2,
+                "--path",
+                str(dep_path2),
+                "--no-deps",
+                "--no-index",
+            ]
+        )
+        project.check_sources([iri0, iri1, iri2])
 
 
 @pytest.mark.parametrize(
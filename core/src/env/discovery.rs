@@ -65,48 +65,69 @@ impl ResolvedEndpoints {
         Self::url_join(&self.index_root, &format!("{path}/"))
     }
 
-    /// Per-version directory URL ending with a trailing slash, so that
-    /// `Url::join` treats it as a directory when composing leaf URLs
-    /// (`project.kpar`, `.project.json`, `.meta.json`).
-    pub(crate) fn version_dir_url<S: AsRef<str>, T: AsRef<str>>(
+    #[cfg(test)]
+    pub(crate) fn kpar_url<S: AsRef<str>, T: AsRef<str>>(
         &self,
         iri: S,
         version: T,
     ) -> Result<url::Url, IndexEnvironmentError> {
-        let base = self.project_url(iri)?;
-        Self::url_join(&base, &format!("{}/", version.as_ref()))
+        Self::kpar_url_in(&self.project_url(iri)?, version)
     }
 
-    pub(crate) fn kpar_url<S: AsRef<str>, T: AsRef<str>>(
+    #[cfg(test)]
+    pub(crate) fn project_json_url<S: AsRef<str>, T: AsRef<str>>(
         &self,
         iri: S,
         version: T,
     ) -> Result<url::Url, IndexEnvironmentError> {
-        Self::url_join(&self.version_dir_url(iri, version)?, KPAR_FILE)
+        Self::project_json_url_in(&self.project_url(iri)?, version)
     }
 
-    pub(crate) fn project_json_url<S: AsRef<str>, T: AsRef<str>>(
-        &self,
-        iri: S,
+    // The `*_in` functions below take a URL returned by `project_url`, so
+    // that callers can keep it around instead of parsing and hashing the
+    // IRI again for every leaf
+
+    /// Per-version directory URL ending with a trailing slash, so that
+    /// `Url::join` treats it as a directory when composing leaf URLs
+    /// (`project.kpar`, `.project.json`, `.meta.json`).
+    pub(crate) fn version_dir_url_in<T: AsRef<str>>(
+        project_url: &url::Url,
         version: T,
     ) -> Result<url::Url, IndexEnvironmentError> {
-        Self::url_join(&self.version_dir_url(iri, version)?, PROJECT_JSON_FILE)
+        Self::url_join(project_url, &format!("{}/", version.as_ref()))
     }
 
-    pub(crate) fn meta_json_url<S: AsRef<str>, T: AsRef<str>>(
-        &self,
-        iri: S,
+    pub(crate) fn kpar_url_in<T: AsRef<str>>(
+        project_url: &url::Url,
         version: T,
     ) -> Result<url::Url, IndexEnvironmentError> {
-        Self::url_join(&self.version_dir_url(iri, version)?, META_JSON_FILE)
+        Self::url_join(&Self::version_dir_url_in(project_url, version)?, KPAR_FILE)
     }
 
-    pub(crate) fn versions_url<S: AsRef<str>>(
-        &self,
-        iri: S,
+    pub(crate) fn project_json_url_in<T: AsRef<str>>(
+        project_url: &url::Url,
+        version: T,
+    ) -> Result<url::Url, IndexEnvironmentError> {
+        Self::url_join(
+            &Self::version_dir_url_in(project_url, version)?,
+            PROJECT_JSON_FILE,
+        )
+    }
+
+    pub(crate) fn meta_json_url_in<T: AsRef<str>>(
+        project_url: &url::Url,
+        version: T,
+    ) -> Result<url::Url, IndexEnvironmentError> {
+        Self::url_join(
+            &Self::version_dir_url_in(project_url, version)?,
+            META_JSON_FILE,
+        )
+    }
+
+    pub(crate) fn versions_url_in(
+        project_url: &url::Url,
     ) -> Result<url::Url, IndexEnvironmentError> {
-        let base = self.project_url(iri)?;
-        Self::url_join(&base, VERSIONS_PATH)
+        Self::url_join(project_url, VERSIONS_PATH)
     }
 }
 
@@ -221,8 +242,14 @@ pub async fn fetch_index_config<P: HTTPAuthentication>(
         .join("sysand-index-config.json")
         .expect("joining a fixed relative path onto an HTTP(S) base URL succeeds");
 
-    let parsed: Option<IndexConfigRaw> =
-        fetch_json(client, auth, &config_url, MissingPolicy::AllowNotFound).await?;
+    let parsed: Option<IndexConfigRaw> = fetch_json(
+        client,
+        auth,
+        &config_url,
+        MissingPolicy::AllowNotFound,
+        None,
+    )
+    .await?;
 
     let Some(raw) = parsed else {
         return Ok(ResolvedEndpoints::flat(directory_root));
@@ -41,7 +41,7 @@ use crate::{
     },
     model::InterchangeProjectUsageRaw,
     project::index_entry::{IndexEntryProject, IndexEntryProjectError},
-    resolve::net_utils::json_get_request,
+    resolve::net_utils::{JsonCache, JsonGetError, JsonGetResponse, json_get_revalidated},
 };
 
 use super::ProjectChecksumResult;
@@ -90,6 +90,17 @@ pub struct IndexEnvironmentAsync<Policy> {
     // This is a Mutex to enable caching in &self methods of ReadEnvironment
     // trait.
     versions_cache: tokio::sync::Mutex<HashMap<String, VersionsCacheEntry>>,
+    /// Intra-run cache of project directory URLs, keyed by IRI. Building
+    /// one canonicalizes the IRI and, outside `pkg:sysand`, hashes it; both
+    /// `versions.json` and every per-version leaf URL live under it.
+    /// Scoped to one env lifetime like `versions_cache`, since the
+    /// endpoints never change once resolved.
+    project_url_cache: tokio::sync::Mutex<HashMap<String, url::Url>>,
+    /// Revalidation cache for `index.json` and the per-version
+    /// `.project.json`/`.meta.json` of projects handed out by this env.
+    /// Shared with those projects, and with other envs and resolvers when
+    /// set through [`Self::with_json_cache`].
+    json_cache: Arc<JsonCache>,
 }
 
 impl<Policy> IndexEnvironmentAsync<Policy> {
@@ -112,6 +123,8 @@ impl<Policy> IndexEnvironmentAsync<Policy> {
             discovery_root: None,
             endpoints: endpoints_cell,
             versions_cache: Default::default(),
+            project_url_cache: Default::default(),
+            json_cache: Default::default(),
         }
     }
 
@@ -130,8 +143,17 @@ impl<Policy> IndexEnvironmentAsync<Policy> {
             discovery_root: Some(discovery_root),
             endpoints: tokio::sync::OnceCell::new(),
             versions_cache: Default::default(),
+            project_url_cache: Default::default(),
+            json_cache: Default::default(),
         }
     }
+
+    /// Revalidate fetched JSON documents against `json_cache` instead of a
+    /// cache of this env's own
+    pub fn with_json_cache(mut self, json_cache: Arc<JsonCache>) -> Self {
+        self.json_cache = json_cache;
+        self
+    }
 }
 
 /// Per-IRI cache slot: validated `versions.json` entries, shared across
@@ -293,41 +315,39 @@ pub(crate) enum MissingPolicy {
 /// Fetch and JSON-parse one document from `url` through `client`+`auth`. A
 /// 404 returns `Ok(None)` under [`MissingPolicy::AllowNotFound`] and a
 /// [`HttpFetchError::BadHttpStatus`] under [`MissingPolicy::RequirePresent`];
-/// any other non-success status is always an error.
+/// any other non-success status is always an error. With a `cache`, a
+/// document fetched before is revalidated instead of downloaded again.
 pub(crate) async fn fetch_json<T: DeserializeOwned, P: HTTPAuthentication>(
     client: &reqwest_middleware::ClientWithMiddleware,
     auth: &P,
     url: &url::Url,
     missing: MissingPolicy,
+    cache: Option<&JsonCache>,
 ) -> Result<Option<T>, HttpFetchError> {
-    let response = auth
-        .with_authentication(client, &json_get_request(url.clone()))
-        .await
-        .map_err(|source| HttpFetchError::Request {
-            url: url.as_str().into(),
-            source,
-        })?;
-
-    let status = response.status();
-
-    if status == reqwest::StatusCode::NOT_FOUND && missing == MissingPolicy::AllowNotFound {
-        return Ok(None);
-    }
-
-    if !status.is_success() {
-        return Err(HttpFetchError::BadHttpStatus {
-            url: url.as_str().into(),
-            status,
-        });
-    }
-
-    let bytes = response
-        .bytes()
-        .await
-        .map_err(|source| HttpFetchError::Body {
-            url: url.as_str().into(),
-            source,
-        })?;
+    let bytes = match json_get_revalidated(client, auth, url, cache).await {
+        Ok(JsonGetResponse::Body(bytes)) => bytes,
+        Ok(JsonGetResponse::Status(status)) => {
+            if status == reqwest::StatusCode::NOT_FOUND && missing == MissingPolicy::AllowNotFound {
+                return Ok(None);
+            }
+            return Err(HttpFetchError::BadHttpStatus {
+                url: url.as_str().into(),
+                status,
+            });
+        }
+        Err(JsonGetError::Request(source)) => {
+            return Err(HttpFetchError::Request {
+                url: url.as_str().into(),
+                source,
+            });
+        }
+        Err(JsonGetError::Body(source)) => {
+            return Err(HttpFetchError::Body {
+                url: url.as_str().into(),
+                source,
+            });
+        }
+    };
 
     serde_json::from_slice::<T>(&bytes)
         .map(Some)
@@ -366,6 +386,7 @@ impl<Policy: HTTPAuthentication> IndexEnvironmentAsync<Policy> {
             &*self.auth_policy,
             &url,
             MissingPolicy::RequirePresent,
+            Some(&self.json_cache),
         )
         .await
         {
@@ -374,6 +395,19 @@ impl<Policy: HTTPAuthentication> IndexEnvironmentAsync<Policy> {
         }
     }
 
+    async fn project_url(&self, iri: &str) -> Result<url::Url, IndexEnvironmentError> {
+        if let Some(cached) = self.project_url_cache.lock().await.get(iri).cloned() {
+            return Ok(cached);
+        }
+
+        let url = self.endpoints().await?.project_url(iri)?;
+        self.project_url_cache
+            .lock()
+            .await
+            .insert(iri.to_owned(), url.clone());
+        Ok(url)
+    }
+
     /// Fetch, validate, and cache `versions.json` for `iri`. See
     /// [`validate_versions`] for the ingest checks. Returns `Ok(None)`
     /// when the server returns 404 — per §8 that means the project is
@@ -389,12 +423,14 @@ impl<Policy: HTTPAuthentication> IndexEnvironmentAsync<Policy> {
             return Ok(Some(cached));
         }
 
-        let url = self.endpoints().await?.versions_url(iri_key)?;
+        let url = ResolvedEndpoints::versions_url_in(&self.project_url(iri_key).await?)?;
         let fetched = fetch_json::<VersionsJson, _>(
             &self.client,
             &*self.auth_policy,
             &url,
             MissingPolicy::AllowNotFound,
+            // Successful fetches end up in `versions_cache` already
+            None,
         )
         .await?;
         let Some(parsed) = fetched else {
@@ -567,8 +603,8 @@ impl<Policy: HTTPAuthentication> ReadEnvironmentAsync for IndexEnvironmentAsync<
         // Validate the requested version against the advertised set
         // before constructing per-version leaf URLs. We only fetch
         // versions the index has explicitly listed in `versions.json`.
-        let endpoints = self.endpoints().await?;
-        let versions_url = endpoints.versions_url(uri.as_ref())?;
+        let project_url = self.project_url(uri.as_ref()).await?;
+        let versions_url = ResolvedEndpoints::versions_url_in(&project_url)?;
         // §8 — a `versions.json` 404 means the project is not in this
         // index. Surface it as a distinct `ProjectNotInIndex` error so
         // direct callers can tell "not here" apart from "the index
@@ -614,9 +650,10 @@ impl<Policy: HTTPAuthentication> ReadEnvironmentAsync for IndexEnvironmentAsync<
         // Build leaf URLs from the validated version (i.e. the `Display` of
         // the parsed `semver::Version`), not the caller-supplied string.
         let advertised_version = advertised.version.to_string();
-        let kpar_url = endpoints.kpar_url(&uri, &advertised_version)?;
-        let project_json_url = endpoints.project_json_url(&uri, &advertised_version)?;
-        let meta_json_url = endpoints.meta_json_url(&uri, &advertised_version)?;
+        let kpar_url = ResolvedEndpoints::kpar_url_in(&project_url, &advertised_version)?;
+        let project_json_url =
+            ResolvedEndpoints::project_json_url_in(&project_url, &advertised_version)?;
+        let meta_json_url = ResolvedEndpoints::meta_json_url_in(&project_url, &advertised_version)?;
 
         let project = IndexEntryProject::new(
             kpar_url,
@@ -625,6 +662,7 @@ impl<Policy: HTTPAuthentication> ReadEnvironmentAsync for IndexEnvironmentAsync<
             advertised,
             self.client.clone(),
             self.auth_policy.clone(),
+            self.json_cache.clone(),
         )
         .map_err(Box::new)?;
 
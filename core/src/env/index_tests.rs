@@ -276,7 +276,7 @@ mod uris {
         );
 
         // Per-version `.project.json` lives in the same version directory; this
-        // also exercises the `version_dir_url` trailing-slash invariant.
+        // also exercises the `version_dir_url_in` trailing-slash invariant.
         assert_eq!(
             endpoints
                 .project_json_url(purl("admin/proj0"), "0.3.0")?
@@ -2017,6 +2017,146 @@ mod caching {
     }
 }
 
+/// Tests for `fetch_json`'s conditional requests against a `JsonCache`:
+/// documents served with `ETag`/`Last-Modified` are revalidated on the
+/// next fetch, and a `304 Not Modified` is answered from the cache.
+mod revalidation {
+    use mockito::Matcher;
+
+    use super::*;
+    use crate::resolve::net_utils::JsonCache;
+
+    const LAST_MODIFIED: &str = "Thu, 01 Jan 2026 00:00:00 GMT";
+
+    fn fetch_value(
+        runtime: &tokio::runtime::Runtime,
+        url: &url::Url,
+        cache: &JsonCache,
+    ) -> Result<Option<serde_json::Value>, HttpFetchError> {
+        let client = create_reqwest_client().expect("client builds");
+        runtime.block_on(super::super::fetch_json(
+            &client,
+            &Unauthenticated {},
+            url,
+            super::super::MissingPolicy::RequirePresent,
+            Some(cache),
+        ))
+    }
+
+    #[test]
+    fn second_fetch_sends_validators_and_304_returns_cached_body()
+    -> Result<(), Box<dyn std::error::Error>> {
+        let mut server = mockito::Server::new();
+        let runtime = make_runtime()?;
+        let cache = JsonCache::default();
+        let url = url::Url::parse(&format!("{}/index.json", server.url()))?;
+
+        let first_mock = server
+            .mock("GET", "/index.json")
+            .match_header("if-none-match", Matcher::Missing)
+            .match_header("if-modified-since", Matcher::Missing)
+            .with_status(200)
+            .with_header("content-type", "application/json")
+            .with_header("etag", "\"v1\"")
+            .with_header("last-modified", LAST_MODIFIED)
+            .with_body(r#"{"projects":["a"]}"#)
+            .expect(1)
+            .create();
+        let revalidate_mock = server
+            .mock("GET", "/index.json")
+            .match_header("if-none-match", "\"v1\"")
+            .match_header("if-modified-since", LAST_MODIFIED)
+            .with_status(304)
+            .expect(1)
+            .create();
+
+        let first = fetch_value(&runtime, &url, &cache)?;
+        let second = fetch_value(&runtime, &url, &cache)?;
+
+        assert_eq!(first, Some(serde_json::json!({"projects": ["a"]})));
+        assert_eq!(second, first);
+
+        first_mock.assert();
+        revalidate_mock.assert();
+
+        Ok(())
+    }
+
+    #[test]
+    fn changed_document_replaces_cached_entry() -> Result<(), Box<dyn std::error::Error>> {
+        let mut server = mockito::Server::new();
+        let runtime = make_runtime()?;
+        let cache = JsonCache::default();
+        let url = url::Url::parse(&format!("{}/index.json", server.url()))?;
+
+        let v1_mock = server
+            .mock("GET", "/index.json")
+            .match_header("if-none-match", Matcher::Missing)
+            .with_status(200)
+            .with_header("etag", "\"v1\"")
+            .with_body(r#"{"projects":["a"]}"#)
+            .expect(1)
+            .create();
+        let v2_mock = server
+            .mock("GET", "/index.json")
+            .match_header("if-none-match", "\"v1\"")
+            .with_status(200)
+            .with_header("etag", "\"v2\"")
+            .with_body(r#"{"projects":["a","b"]}"#)
+            .expect(1)
+            .create();
+        let not_modified_mock = server
+            .mock("GET", "/index.json")
+            .match_header("if-none-match", "\"v2\"")
+            .with_status(304)
+            .expect(1)
+            .create();
+
+        let first = fetch_value(&runtime, &url, &cache)?;
+        let second = fetch_value(&runtime, &url, &cache)?;
+        let third = fetch_value(&runtime, &url, &cache)?;
+
+        assert_eq!(first, Some(serde_json::json!({"projects": ["a"]})));
+        assert_eq!(second, Some(serde_json::json!({"projects": ["a", "b"]})));
+        // The 304 must be answered from the v2 entry, not the stale v1 one
+        assert_eq!(third, second);
+
+        v1_mock.assert();
+        v2_mock.assert();
+        not_modified_mock.assert();
+
+        Ok(())
+    }
+
+    #[test]
+    fn not_modified_without_cached_entry_is_bad_status() -> Result<(), Box<dyn std::error::Error>> {
+        let mut server = mockito::Server::new();
+        let runtime = make_runtime()?;
+        let cache = JsonCache::default();
+        let url = url::Url::parse(&format!("{}/index.json", server.url()))?;
+
+        let mock = server
+            .mock("GET", "/index.json")
+            .with_status(304)
+            .expect(1)
+            .create();
+
+        let err = fetch_value(&runtime, &url, &cache).expect_err("304 with nothing cached");
+        assert!(
+            matches!(
+                err,
+                HttpFetchError::BadHttpStatus { status, .. }
+                    if status == reqwest::StatusCode::NOT_MODIFIED
+            ),
+            "unexpected error: {err:?}"
+        );
+
+        mock.assert();
+
+        Ok(())
+    }
+}
+
 /// Tests for `read_source` / `sources` — the kpar-backed paths.
 ///
 /// Shared shape these tests pin:
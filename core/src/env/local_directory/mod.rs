@@ -244,7 +244,9 @@ impl LocalDirectoryEnvironment {
         path.into()
     }
 
-    fn warn_if_old_sysand_env_present(root_dir: &Utf8Path) {
+    /// Warn if the `sysand_env` directory used by older Sysand versions is
+    /// present next to `root_dir`
+    pub fn warn_if_old_sysand_env_present(root_dir: &Utf8Path) {
         let parent = root_dir.parent().unwrap();
         let path = parent.join("sysand_env");
         match fs::metadata(&path) {
@@ -40,6 +40,7 @@ use crate::{
             ReqwestRemoteKparDownloadedProject,
         },
     },
+    resolve::net_utils::JsonCache,
 };
 
 use super::ProjectChecksum;
@@ -58,6 +59,8 @@ pub struct IndexEntryProject<Policy> {
     pub(crate) meta_json_url: reqwest::Url,
     pub(crate) fetched_info_meta:
         OnceCell<(InterchangeProjectInfoRaw, InterchangeProjectMetadataRaw)>,
+    /// Shared with the index environment that created this project
+    pub(crate) json_cache: Arc<JsonCache>,
 }
 
 #[derive(Error, Debug)]
@@ -79,6 +82,7 @@ impl<Policy: HTTPAuthentication> IndexEntryProject<Policy> {
         advertised: AdvertisedVersion,
         client: reqwest_middleware::ClientWithMiddleware,
         auth_policy: Arc<Policy>,
+        json_cache: Arc<JsonCache>,
     ) -> Result<Self, IndexEntryProjectError> {
         Ok(Self {
             archive: ReqwestIndexKparDownloadedProject::new(
@@ -92,6 +96,7 @@ impl<Policy: HTTPAuthentication> IndexEntryProject<Policy> {
             project_json_url,
             meta_json_url,
             fetched_info_meta: OnceCell::new(),
+            json_cache,
         })
     }
 
@@ -108,6 +113,7 @@ impl<Policy: HTTPAuthentication> IndexEntryProject<Policy> {
             &*self.archive.auth_policy,
             &url,
             MissingPolicy::RequirePresent,
+            Some(&self.json_cache),
         )
         .await?
         .expect("RequirePresent never returns Ok(None)"))
@@ -64,6 +64,7 @@ fn make_fixture() -> IndexEntryProject<Unauthenticated> {
         advertised,
         create_reqwest_client().expect("reqwest client builder succeeds"),
         Arc::new(Unauthenticated {}),
+        Default::default(),
     )
     .expect("IndexEntryProject::new has no fallible steps given a temp dir")
 }
@@ -15,7 +15,10 @@ use crate::{
     lock::Source,
     model::{InterchangeProjectInfoRaw, InterchangeProjectMetadataRaw},
     project::{CanonicalizationError, ProjectReadAsync, utils::FsIoError},
-    resolve::net_utils::{json_get_request, json_head_request, text_get_request},
+    resolve::net_utils::{
+        JsonCache, JsonGetError, JsonGetResponse, json_get_revalidated, json_head_request,
+        text_get_request,
+    },
 };
 
 use super::ProjectChecksum;
@@ -38,6 +41,9 @@ pub struct ReqwestSrcProjectAsync<Policy> {
     pub url: reqwest::Url,
     pub auth_policy: Arc<Policy>,
     pub expected_checksum: Option<String>,
+    /// Revalidation cache for `.project.json`/`.meta.json`, usually shared
+    /// with the resolver that created this project
+    pub json_cache: Arc<JsonCache>,
 }
 
 impl<Policy> ReqwestSrcProjectAsync<Policy> {
@@ -74,6 +80,15 @@ pub enum ReqwestSrcError {
     Io(#[from] Box<FsIoError>),
 }
 
+impl From<JsonGetError> for ReqwestSrcError {
+    fn from(value: JsonGetError) -> Self {
+        match value {
+            JsonGetError::Request(err) => ReqwestSrcError::ReqwestMiddleware(err),
+            JsonGetError::Body(err) => ReqwestSrcError::Reqwest(err),
+        }
+    }
+}
+
 impl<Policy: HTTPAuthentication> ProjectReadAsync for ReqwestSrcProjectAsync<Policy> {
     type Error = ReqwestSrcError;
 
@@ -92,32 +107,36 @@ impl<Policy: HTTPAuthentication> ProjectReadAsync for ReqwestSrcProjectAsync<Pol
     }
 
     async fn get_info_async(&self) -> Result<Option<InterchangeProjectInfoRaw>, Self::Error> {
-        let info_resp = self
-            .auth_policy
-            .with_authentication(&self.client, &json_get_request(self.info_url()))
-            .await
-            .map_err(ReqwestSrcError::ReqwestMiddleware)?;
-
-        Ok(if info_resp.status().is_success() {
-            let rep = info_resp.text().await.map_err(ReqwestSrcError::Reqwest)?;
-            Some(serde_json::from_str(&rep).map_err(|e| ReqwestSrcError::Deserialize(rep, e))?)
-        } else {
-            None
+        let info_resp = json_get_revalidated(
+            &self.client,
+            &*self.auth_policy,
+            &self.info_url(),
+            Some(&self.json_cache),
+        )
+        .await?;
+
+        Ok(match info_resp {
+            JsonGetResponse::Body(rep) => Some(serde_json::from_slice(&rep).map_err(|e| {
+                ReqwestSrcError::Deserialize(String::from_utf8_lossy(&rep).into_owned(), e)
+            })?),
+            JsonGetResponse::Status(_) => None,
         })
     }
 
     async fn get_meta_async(&self) -> Result<Option<InterchangeProjectMetadataRaw>, Self::Error> {
-        let meta_resp = self
-            .auth_policy
-            .with_authentication(&self.client, &json_get_request(self.meta_url()))
-            .await
-            .map_err(ReqwestSrcError::ReqwestMiddleware)?;
-
-        Ok(if meta_resp.status().is_success() {
-            let rep = meta_resp.text().await.map_err(ReqwestSrcError::Reqwest)?;
-            Some(serde_json::from_str(&rep).map_err(|e| ReqwestSrcError::Deserialize(rep, e))?)
-        } else {
-            None
+        let meta_resp = json_get_revalidated(
+            &self.client,
+            &*self.auth_policy,
+            &self.meta_url(),
+            Some(&self.json_cache),
+        )
+        .await?;
+
+        Ok(match meta_resp {
+            JsonGetResponse::Body(rep) => Some(serde_json::from_slice(&rep).map_err(|e| {
+                ReqwestSrcError::Deserialize(String::from_utf8_lossy(&rep).into_owned(), e)
+            })?),
+            JsonGetResponse::Status(_) => None,
         })
     }
 
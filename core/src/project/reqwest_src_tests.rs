@@ -9,7 +9,7 @@ use typed_path::Utf8UnixPath;
 use crate::{
     auth::Unauthenticated,
     project::{ProjectRead, ProjectReadAsync, reqwest_src::ReqwestSrcProjectAsync},
-    resolve::net_utils::create_reqwest_client,
+    resolve::net_utils::{JsonCache, create_reqwest_client},
 };
 
 #[test]
@@ -25,6 +25,7 @@ fn empty_remote_definitely_invalid_http_src() -> Result<(), Box<dyn std::error::
         url,
         auth_policy: Arc::new(Unauthenticated {}),
         expected_checksum: None,
+        json_cache: Default::default(),
     }
     .to_tokio_sync(Arc::new(
         tokio::runtime::Builder::new_current_thread()
@@ -80,6 +81,7 @@ fn basic_project_urls_http_src() -> Result<(), Box<dyn std::error::Error>> {
         url,
         auth_policy: Arc::new(Unauthenticated {}),
         expected_checksum: None,
+        json_cache: Default::default(),
     }
     .to_tokio_sync(Arc::new(
         tokio::runtime::Builder::new_current_thread()
@@ -113,3 +115,86 @@ fn basic_project_urls_http_src() -> Result<(), Box<dyn std::error::Error>> {
 
     Ok(())
 }
+
+#[test]
+fn shared_json_cache_revalidates_info_meta_http_src() -> Result<(), Box<dyn std::error::Error>> {
+    let mut server = mockito::Server::new();
+
+    let url = reqwest::Url::parse(&server.url()).unwrap();
+
+    let info_body = r#"{"name":"shared_json_cache","version":"1.2.3"}"#;
+    let meta_body = r#"{"index":{},"created":"0000-00-00T00:00:00.123456789Z"}"#;
+    let last_modified = "Thu, 01 Jan 2026 00:00:00 GMT";
+
+    // Requests from a project with an empty cache carry no validators
+    let info_mock = server
+        .mock("GET", "/.project.json")
+        .match_header("if-none-match", mockito::Matcher::Missing)
+        .with_status(200)
+        .with_header("content-type", "application/json")
+        .with_header("etag", "\"info-1\"")
+        .with_body(info_body)
+        .expect(2)
+        .create();
+    let meta_mock = server
+        .mock("GET", "/.meta.json")
+        .match_header("if-modified-since", mockito::Matcher::Missing)
+        .with_status(200)
+        .with_header("content-type", "application/json")
+        .with_header("last-modified", last_modified)
+        .with_body(meta_body)
+        .expect(2)
+        .create();
+    let info_not_modified_mock = server
+        .mock("GET", "/.project.json")
+        .match_header("if-none-match", "\"info-1\"")
+        .with_status(304)
+        .expect(1)
+        .create();
+    let meta_not_modified_mock = server
+        .mock("GET", "/.meta.json")
+        .match_header("if-modified-since", last_modified)
+        .with_status(304)
+        .expect(1)
+        .create();
+
+    let client = create_reqwest_client()?;
+    let runtime = Arc::new(
+        tokio::runtime::Builder::new_current_thread()
+            .enable_all()
+            .build()?,
+    );
+    let project_with_cache = |json_cache| {
+        ReqwestSrcProjectAsync {
+            client: client.clone(),
+            url: url.clone(),
+            auth_policy: Arc::new(Unauthenticated {}),
+            expected_checksum: None,
+            json_cache,
+        }
+        .to_tokio_sync(runtime.clone())
+    };
+
+    // Two projects sharing one cache, like the projects of two resolvers
+    // built from the same cache: the second one revalidates
+    let json_cache = Arc::new(JsonCache::default());
+    let first = project_with_cache(json_cache.clone()).get_project()?;
+    let second = project_with_cache(json_cache).get_project()?;
+    // A project with a cache of its own downloads everything again
+    let third = project_with_cache(Default::default()).get_project()?;
+
+    let (Some(info), Some(meta)) = &first else {
+        panic!("first fetch returned no info/meta: {first:?}")
+    };
+    assert_eq!(info.name, "shared_json_cache");
+    assert_eq!(meta.created, "0000-00-00T00:00:00.123456789Z");
+    assert_eq!(second, first);
+    assert_eq!(third, first);
+
+    info_mock.assert();
+    meta_mock.assert();
+    info_not_modified_mock.assert();
+    meta_not_modified_mock.assert();
+
+    Ok(())
+}
@@ -1,12 +1,24 @@
 // SPDX-License-Identifier: MIT OR Apache-2.0
 // SPDX-FileCopyrightText: © 2026 Sysand contributors <opensource@sensmetry.com>
 
-use std::{error::Error, fmt::Display};
+use std::{
+    collections::HashMap,
+    error::Error,
+    fmt::Display,
+    sync::{Mutex, MutexGuard, PoisonError},
+};
 
-use reqwest::header;
+use bytes::Bytes;
+use reqwest::{
+    StatusCode,
+    header::{self, HeaderValue},
+};
 use reqwest_middleware::{ClientWithMiddleware, RequestBuilder};
+use thiserror::Error;
 use url::Url;
 
+use crate::auth::HTTPAuthentication;
+
 // application/vnd.github.raw is required for GitHub API to return raw
 // file contents
 const KPAR_ACCEPT: &str = "application/zip, application/octet-stream, application/vnd.github.raw";
@@ -26,14 +38,133 @@ pub fn kpar_get_request(url: impl Into<Url>) -> impl Fn(&ClientWithMiddleware) -
     }
 }
 
-/// For JSON files
-pub fn json_get_request(url: impl Into<Url>) -> impl Fn(&ClientWithMiddleware) -> RequestBuilder {
-    let this_url = url.into();
-    move |client: &ClientWithMiddleware| -> RequestBuilder {
-        client
+/// Body of a JSON document fetched earlier, together with the validators
+/// the server sent for it
+#[derive(Clone, Debug)]
+struct CachedJson {
+    etag: Option<HeaderValue>,
+    last_modified: Option<HeaderValue>,
+    body: Bytes,
+}
+
+/// Most documents a [`JsonCache`] holds at once
+const JSON_CACHE_MAX_ENTRIES: usize = 1024;
+
+/// Cache for [`json_get_revalidated`], keyed by URL. Only responses that
+/// carry an `ETag` or `Last-Modified` header are stored, since anything
+/// else cannot be revalidated. Once full, an arbitrary entry is evicted
+/// for each new one.
+///
+/// Resolvers and environments share one through an `Arc` with the
+/// projects they hand out. Callers that build a new resolver for every
+/// request can pass the same cache to each of them to keep it warm.
+#[derive(Debug, Default)]
+pub struct JsonCache {
+    entries: Mutex<HashMap<Url, CachedJson>>,
+}
+
+impl JsonCache {
+    fn entries(&self) -> MutexGuard<'_, HashMap<Url, CachedJson>> {
+        self.entries.lock().unwrap_or_else(PoisonError::into_inner)
+    }
+
+    fn insert(&self, url: &Url, cached: CachedJson) {
+        let mut entries = self.entries();
+        if entries.len() >= JSON_CACHE_MAX_ENTRIES
+            && !entries.contains_key(url)
+            && let Some(evicted) = entries.keys().next().cloned()
+        {
+            entries.remove(&evicted);
+        }
+        entries.insert(url.clone(), cached);
+    }
+}
+
+#[derive(Debug)]
+pub enum JsonGetResponse {
+    /// Body of a successful response, or the cached body if the server
+    /// answered `304 Not Modified`
+    Body(Bytes),
+    /// Status of any other response
+    Status(StatusCode),
+}
+
+#[derive(Error, Debug)]
+pub enum JsonGetError {
+    #[error("error making an HTTP request:\n{0:#?}")]
+    Request(reqwest_middleware::Error),
+    #[error("error reading an HTTP response body:\n{0:#?}")]
+    Body(reqwest::Error),
+}
+
+/// GET a JSON document. If `cache` holds an earlier copy of the same URL,
+/// the request carries `If-None-Match`/`If-Modified-Since` so that an
+/// unchanged document is answered with an empty `304 Not Modified`.
+/// Without a `cache` this is a plain GET.
+pub async fn json_get_revalidated<P: HTTPAuthentication>(
+    client: &ClientWithMiddleware,
+    auth: &P,
+    url: &Url,
+    cache: Option<&JsonCache>,
+) -> Result<JsonGetResponse, JsonGetError> {
+    let cached = cache.and_then(|cache| cache.entries().get(url).cloned());
+
+    let this_url = url.clone();
+    let validators = cached
+        .as_ref()
+        .map(|cached| (cached.etag.clone(), cached.last_modified.clone()));
+    let request = move |client: &ClientWithMiddleware| -> RequestBuilder {
+        let mut request = client
             .get(this_url.clone())
-            .header(header::ACCEPT, JSON_ACCEPT)
+            .header(header::ACCEPT, JSON_ACCEPT);
+        if let Some((etag, last_modified)) = &validators {
+            if let Some(etag) = etag {
+                request = request.header(header::IF_NONE_MATCH, etag.clone());
+            }
+            if let Some(last_modified) = last_modified {
+                request = request.header(header::IF_MODIFIED_SINCE, last_modified.clone());
+            }
+        }
+        request
+    };
+
+    let response = auth
+        .with_authentication(client, &request)
+        .await
+        .map_err(JsonGetError::Request)?;
+    let status = response.status();
+
+    if status == StatusCode::NOT_MODIFIED
+        && let Some(cached) = cached
+    {
+        log::debug!("`{url}` not modified, using cached copy");
+        return Ok(JsonGetResponse::Body(cached.body));
+    }
+    if !status.is_success() {
+        return Ok(JsonGetResponse::Status(status));
+    }
+
+    let etag = response.headers().get(header::ETAG).cloned();
+    let last_modified = response.headers().get(header::LAST_MODIFIED).cloned();
+    let body = response.bytes().await.map_err(JsonGetError::Body)?;
+
+    if let Some(cache) = cache {
+        if etag.is_some() || last_modified.is_some() {
+            cache.insert(
+                url,
+                CachedJson {
+                    etag,
+                    last_modified,
+                    body: body.clone(),
+                },
+            );
+        } else {
+            // A fresh copy without validators supersedes the cached one
+            cache.entries().remove(url);
+        }
     }
+
+    Ok(JsonGetResponse::Body(body))
 }
 
 pub fn json_head_request(url: impl Into<Url>) -> impl Fn(&ClientWithMiddleware) -> RequestBuilder {
@@ -16,7 +16,7 @@ use crate::{
         reqwest_kpar_download::ReqwestRemoteKparDownloadedProject,
         reqwest_src::ReqwestSrcProjectAsync,
     },
-    resolve::ResolveReadAsync,
+    resolve::{ResolveReadAsync, net_utils::JsonCache},
     utils::scheme::{SCHEME_HTTP, SCHEME_HTTPS},
 };
 
@@ -28,6 +28,9 @@ pub struct HTTPResolverAsync<Policy> {
     pub client: reqwest_middleware::ClientWithMiddleware,
     pub lax: bool,
     pub auth_policy: Arc<Policy>,
+    /// Shared by all source projects this resolver hands out, so that
+    /// repeated resolutions of the same URL can be revalidated
+    pub json_cache: Arc<JsonCache>,
     //pub prefer_ranged: bool,
 }
 
@@ -241,6 +244,7 @@ pub struct HTTPProjects<Policy> {
     // See the comments in `try_resolve_as_src`.
     lax: bool,
     auth_policy: Arc<Policy>,
+    json_cache: Arc<JsonCache>,
     //prefer_ranged: bool,
 }
 
@@ -292,6 +296,7 @@ impl<Policy: HTTPAuthentication> HTTPProjects<Policy> {
                 url: self.url.clone(),
                 auth_policy: auth_policy.clone(),
                 expected_checksum: None,
+                json_cache: self.json_cache.clone(),
             }))
         // If the resolver is set to be lax, try forcing the terminal slash
         } else if self.lax {
@@ -305,6 +310,7 @@ impl<Policy: HTTPAuthentication> HTTPProjects<Policy> {
                 url: lax_url,
                 auth_policy,
                 expected_checksum: None,
+                json_cache: self.json_cache.clone(),
             }))
         } else {
             None
@@ -365,6 +371,7 @@ impl<Policy: HTTPAuthentication> ResolveReadAsync for HTTPResolverAsync<Policy>
                         kpar_done: false,
                         lax: self.lax,
                         auth_policy: self.auth_policy.clone(),
+                        json_cache: self.json_cache.clone(),
                         // prefer_ranged: self.prefer_ranged,
                     }))
                 } else {
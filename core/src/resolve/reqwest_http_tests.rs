@@ -38,7 +38,8 @@ fn basic_http_src_url_non_lax() -> Result<(), Box<dyn std::error::Error>> {
     let resolver = super::HTTPResolverAsync {
         client,
         lax: false,
-        auth_policy: Arc::new(Unauthenticated {}), //prefer_ranged: true,
+        auth_policy: Arc::new(Unauthenticated {}),
+        json_cache: Default::default(), //prefer_ranged: true,
     }
     .to_tokio_sync(Arc::new(
         tokio::runtime::Builder::new_current_thread()
@@ -79,7 +80,8 @@ fn template_basic_http_url_lax(
     let resolver = super::HTTPResolverAsync {
         client,
         lax: true,
-        auth_policy: Arc::new(Unauthenticated {}), //prefer_ranged,
+        auth_policy: Arc::new(Unauthenticated {}),
+        json_cache: Default::default(), //prefer_ranged,
     }
     .to_tokio_sync(Arc::new(
         tokio::runtime::Builder::new_current_thread()
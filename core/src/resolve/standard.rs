@@ -18,6 +18,7 @@ use crate::{
         env::EnvResolver,
         file::FileResolver,
         gix_git::GitResolver,
+        net_utils::JsonCache,
         remote::{RemotePriority, RemoteResolver},
         reqwest_http::HTTPResolverAsync,
         sequential::SequentialResolver,
@@ -70,13 +71,15 @@ pub fn standard_remote_resolver<Policy: HTTPAuthentication>(
     client: ClientWithMiddleware,
     runtime: Arc<tokio::runtime::Runtime>,
     auth_policy: Arc<Policy>,
+    json_cache: Arc<JsonCache>,
 ) -> RemoteResolver<AsSyncResolveTokio<HTTPResolverAsync<Policy>>, GitResolver> {
     RemoteResolver {
         http_resolver: Some(
             HTTPResolverAsync {
                 client,
                 lax: true,
-                auth_policy, //prefer_ranged: true,
+                auth_policy,
+                json_cache, //prefer_ranged: true,
             }
             .to_tokio_sync(runtime),
         ),
@@ -94,6 +97,7 @@ pub fn standard_index_resolver<Policy: HTTPAuthentication>(
     urls: Vec<url::Url>,
     runtime: Arc<tokio::runtime::Runtime>,
     auth_policy: Arc<Policy>,
+    json_cache: Arc<JsonCache>,
 ) -> Result<AsSyncResolveTokio<RemoteIndexResolver<Policy>>, DiscoveryError> {
     // Each user-configured URL is a discovery root. Do not fetch
     // `sysand-index-config.json` here: resolver construction happens for
@@ -106,7 +110,8 @@ pub fn standard_index_resolver<Policy: HTTPAuthentication>(
                 client.clone(),
                 auth_policy.clone(),
                 discovery_root,
-            );
+            )
+            .with_json_cache(json_cache.clone());
             EnvResolver { env }
         })
         .collect();
@@ -121,15 +126,39 @@ pub fn standard_resolver<Policy: HTTPAuthentication>(
     index_urls: Option<Vec<url::Url>>,
     runtime: Arc<tokio::runtime::Runtime>,
     auth_policy: Arc<Policy>,
+) -> Result<StandardResolver<Policy>, DiscoveryError> {
+    standard_resolver_with_json_cache(
+        cwd,
+        local_env,
+        client,
+        index_urls,
+        runtime,
+        auth_policy,
+        Default::default(),
+    )
+}
+
+/// Same as [`standard_resolver`], but revalidates fetched JSON documents
+/// against `json_cache`, which may outlive the resolver
+pub fn standard_resolver_with_json_cache<Policy: HTTPAuthentication>(
+    cwd: Option<Utf8PathBuf>,
+    local_env: Option<LocalDirectoryEnvironment>,
+    client: Option<ClientWithMiddleware>,
+    index_urls: Option<Vec<url::Url>>,
+    runtime: Arc<tokio::runtime::Runtime>,
+    auth_policy: Arc<Policy>,
+    json_cache: Arc<JsonCache>,
 ) -> Result<StandardResolver<Policy>, DiscoveryError> {
     let file_resolver = standard_file_resolver(cwd);
     let local_resolver = local_env.map(standard_local_resolver);
-    let remote_resolver = client
-        .clone()
-        .map(|x| standard_remote_resolver(x, runtime.clone(), auth_policy.clone()));
+    let remote_resolver = client.clone().map(|x| {
+        standard_remote_resolver(x, runtime.clone(), auth_policy.clone(), json_cache.clone())
+    });
     let index_resolver = client
         .zip(index_urls)
-        .map(|(client, urls)| standard_index_resolver(client, urls, runtime, auth_policy))
+        .map(|(client, urls)| {
+            standard_index_resolver(client, urls, runtime, auth_policy, json_cache)
+        })
         .transpose()?;
 
     Ok(StandardResolver(CombinedResolver {
@@ -58,6 +58,7 @@ pub fn command_sync<P: AsRef<Utf8Path>, Policy: HTTPAuthentication>(
                     url: reqwest::Url::parse(&remote_src)?,
                     auth_policy: auth_policy.clone(),
                     expected_checksum: Some(checksum),
+                    json_cache: Default::default(),
                 }
                 .to_tokio_sync(runtime.clone()))
             },